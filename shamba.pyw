@@ -23,6 +23,7 @@ from shamba.gui.general_dialog import GeneralDialog
 from shamba.gui.project_dialog import ProjectDialog
 from shamba.gui.name_dialog import NameDialog
 from shamba.gui.translate_ import translate_ as _
+from shamba.gui.translate_ import clear_cache as clear_translations
 from shamba.gui.page_change import NextBackButtons
 
 from shamba.gui.general_model import GeneralModel
@@ -44,6 +45,10 @@ class MainInterface(QtWidgets.QMainWindow, Ui_SHAMBA):
 
     def __init__(self, parent=None):
         super(MainInterface, self).__init__(parent) # init QMainWindow
+
+        # translators are installed before this window exists (so it
+        # gets no LanguageChange) - drop anything _() cached before then
+        clear_translations()
         
         self.setupUi(self)  # init Ui from designer 
         self.show()       
@@ -354,6 +359,15 @@ class MainInterface(QtWidgets.QMainWindow, Ui_SHAMBA):
                 event.accept()
             else:   # cancelled
                 event.ignore()
+
+    def changeEvent(self, event):
+        """
+        Override changeEvent so cached translations are dropped
+        when a translator is (un)installed.
+        """
+        if event.type() == QtCore.QEvent.LanguageChange:
+            clear_translations()
+        QtWidgets.QMainWindow.changeEvent(self, event)
        
     def show_save_dialog(self):
         """Popup dialog that shows on a close event."""
@@ -3,6 +3,8 @@
 """ Contains classes for all the setup of the page widgets."""
 
 import os
+from collections import defaultdict
+from functools import partial
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from shamba.gui.translate_ import translate_ as _
@@ -23,24 +25,31 @@ class GenericDialog(QtWidgets.QDialog):
         # help text
         self.help_text = {}
 
-        # To store page info
+        # To store page info - a PageSpec keyed by page, so pages without
+        # a particular bit of info just get an empty list/dict
         self.pageList = []
-        self.toComplete = {}
-        self.toCompleteConditional = {}
-        self.toToggle = {}
-        self.buttonsToShowPage = {}
-        self.buttonsToHidePage = {}
-        self.spinboxesToShowPage = {}
-        self.buttonGroups = {}
-        self.comBox = {}
-       
-        self.parList = [
-                self.toComplete, self.toCompleteConditional, self.toToggle, 
-                self.buttonsToShowPage, self.buttonsToHidePage, 
-                self.spinboxesToShowPage, self.buttonGroups, self.comBox
-        ]
+        self.pageSpecs = defaultdict(PageSpec)
+
+        # {objectName: widget} for each page, see _name_map
+        self._nameMaps = {}
 
     
+    def _name_map(self, page):
+        """Return dict of all the widgets on page, keyed by objectName.
+
+        Made with a single walk of the page's children (rather than a
+        findChild call per widget) and cached for later calls.
+        """
+        try:
+            return self._nameMaps[page]
+        except KeyError:
+            names = {
+                    str(w.objectName()): w 
+                    for w in page.findChildren(QtWidgets.QWidget)
+            }
+            self._nameMaps[page] = names
+            return names
+
     def mousePressEvent(self, event):
         """ Override mousePressEvent so field is cleared when a 
         non-widget item in the window is clicked."""
@@ -49,8 +58,11 @@ class GenericDialog(QtWidgets.QDialog):
             focusedWidget.clearFocus()
         QtWidgets.QDialog.mousePressEvent(self, event)
  
-    def browse_for_file(self, lineEdit):
-        """Open a QFileDialog and show the chosen path in lineEdit."""
+    def browse_for_file(self, lineEdit, checked=False):
+        """Open a QFileDialog and show the chosen path in lineEdit.
+
+        checked is the (unused) argument of the button's clicked signal.
+        """
         filename = QtWidgets.QFileDialog.getOpenFileName(
                 self, _('Open File'), 
                 os.path.abspath(cfg.PROJ_DIR),
@@ -59,9 +71,11 @@ class GenericDialog(QtWidgets.QDialog):
         if filename:    # not cancelled
             lineEdit.setText(filename[0])
 
-    def browse_for_dir(self, lineEdit):
+    def browse_for_dir(self, lineEdit, checked=False):
         """Open a QFileDialog.getExistingDirectory and show chosen dir in 
         lineEdit.
+
+        checked is the (unused) argument of the button's clicked signal.
         """
         dirname = QtWidgets.QFileDialog.getExistingDirectory(
                 self, _('Select Folder'),
@@ -70,6 +84,11 @@ class GenericDialog(QtWidgets.QDialog):
         if dirname:     # not cancelled
             lineEdit.setText(dirname)
     
+    @QtCore.pyqtSlot()
+    def show_current_help(self):
+        """Show help for the current page of the stackedWidget."""
+        self.show_help(self.stackedWidget.currentWidget())
+
     def show_help(self, page):
         """Open a QMessageBox.about dialog to show help text
 
@@ -88,11 +107,14 @@ class GenericDialog(QtWidgets.QDialog):
         help_dialog.setText(_(text))
         help_dialog.show()
         
-    def sort_pages(self, sw, pageList):
+    def sort_pages(self, sw, pageList, finishedPage=None):
         """
         Order the pages (widgets) currently in the stacked widget (sw)
          according to the order of pageList
 
+        finishedPage is the (unused) argument of the 
+        NextBackButtons.finishedPage signal.
+
         Done so that page order doesn't get screwed up when pages
         are removed/added to the stackedWidget
 
@@ -130,6 +152,30 @@ class GenericDialog(QtWidgets.QDialog):
         ret = popup.exec_()
         return ret
 
+class PageSpec(object):
+    """
+    Info for setting up a page in the stackedWidget - see GenericPage
+    for what each attribute holds.
+    """
+    __slots__ = (
+            'toComplete', 'toCompleteConditional', 'toToggle',
+            'buttonsToShowPage', 'buttonsToHidePage', 'spinboxesToShowPage',
+            'buttonGroups', 'comboBoxes'
+    )
+
+    def __init__(self):
+        # toComplete is added to as the page is used, so is a list -
+        # the rest are only iterated over, so can be any sequence
+        self.toComplete = []
+        self.toCompleteConditional = ()
+        self.toToggle = {}
+        self.buttonsToShowPage = ()
+        self.buttonsToHidePage = ()
+        self.spinboxesToShowPage = ()
+        self.buttonGroups = ()
+        self.comboBoxes = {}
+
+
 class GenericPage(QtWidgets.QWidget):
     """
     Object to handle all the things pertaining 
@@ -138,23 +184,14 @@ class GenericPage(QtWidgets.QWidget):
     in qt-designer.
     
     """
-    def __init__(
-            self, pageWidget, stackedWidget, buttons,
-            toComplete=[],
-            toCompleteConditional=[],
-            toToggle={},
-            buttonsToShowPage=[],
-            buttonsToHidePage=[],
-            spinboxesToShowPage=[],
-            buttonGroups=[],
-            comboBoxes={}
-    ):
-            
+    def __init__(self, pageWidget, stackedWidget, buttons, spec):
         """
         Initialise object.
 
         pageWidget: widget of page in question
         stackedWidget: stacked widget where pageWidget is located
+        buttons: NextBackButtons object for the stackedWidget
+        spec: PageSpec with the following attributes
         toComplete: list of QObjects on page that need are required
                     (need to be completed before moving on to next page)
         toToggle: dict with list of objects to initially hide in the value,
@@ -174,6 +211,15 @@ class GenericPage(QtWidgets.QWidget):
 
         super(GenericPage, self).__init__()
         
+        toComplete = spec.toComplete
+        toCompleteConditional = spec.toCompleteConditional
+        toToggle = spec.toToggle
+        buttonsToShowPage = spec.buttonsToShowPage
+        buttonsToHidePage = spec.buttonsToHidePage
+        spinboxesToShowPage = spec.spinboxesToShowPage
+        buttonGroups = spec.buttonGroups
+        comboBoxes = spec.comboBoxes
+
         self.pageIndex = stackedWidget.indexOf(pageWidget)
 
         if buttonsToShowPage or buttonsToHidePage:
@@ -206,20 +252,25 @@ class GenericPage(QtWidgets.QWidget):
         page in the stackedWidget when a button is toggled.
         """
         # button toggling to show page
+        show = partial(self._show_page, stackedWidget, pageWidget)
+        hide = partial(self._hide_page, stackedWidget, pageWidget)
         for s in buttonsToShowPage:
-            s.toggled.connect(
-                    lambda: stackedWidget.insertWidget(
-                            self.pageIndex, pageWidget)
-            )
+            s.toggled.connect(show)
         for h in buttonsToHidePage:
-            h.toggled.connect(
-                    lambda: stackedWidget.removeWidget(pageWidget)
-            )
+            h.toggled.connect(hide)
 
         # set initial state (if any hide buttons are initially pressed)
         if any([h.isChecked() for h in buttonsToHidePage]):
             stackedWidget.removeWidget(pageWidget)
 
+    def _show_page(self, stackedWidget, pageWidget, checked=False):
+        """Put pageWidget back in the stackedWidget at its index."""
+        stackedWidget.insertWidget(self.pageIndex, pageWidget)
+
+    def _hide_page(self, stackedWidget, pageWidget, checked=False):
+        """Take pageWidget out of the stackedWidget."""
+        stackedWidget.removeWidget(pageWidget)
+
     def setup_spinbox_showpage(
             self, pageWidget, stackedWidget, 
             buttons, spinboxesToShowPage):
@@ -240,7 +291,7 @@ class GenericPage(QtWidgets.QWidget):
         for spinbox, minShowNum in spinboxesToShowPage:
             toggle_page(spinbox.value(), minShowNum)
             spinbox.valueChanged.connect(
-                    lambda: toggle_page(spinbox.value(), minShowNum)
+                    partial(toggle_page, minShowNum=minShowNum)
             )
 
     def setup_toggle(self, toToggle, disable=False):
@@ -279,19 +330,18 @@ class GenericPage(QtWidgets.QWidget):
             elif isinstance(toggler, QtWidgets.QComboBox):
                 # always last option in combobox that does the toggling
                 toggler.currentIndexChanged.connect(
-                        lambda: show_if_last_item(
-                                        toggler.currentIndex(),
-                                        toggler.count(),
-                                        toToggle[toggler]
-                        )
+                        partial(show_if_last_item, 
+                                count=toggler.count(),
+                                object_list=toToggle[toggler])
                 )
             elif isinstance(toggler, QtWidgets.QSpinBox):
                 toggler.valueChanged.connect(
-                        lambda: show_if_nonzero(
-                                        toggler.value(),
-                                        toToggle[toggler]
-                        )
+                        partial(show_if_nonzero, 
+                                object_list=toToggle[toggler])
                 )
+                # spinbox can start off non-zero, so show the objects
+                # straight away rather than waiting for valueChanged
+                show_if_nonzero(toggler.value(), toToggle[toggler])
 
 
     def setup_button_groups(self, buttonGroups):
@@ -19,6 +19,28 @@ This software is provided under the University of Edinburgh's Open Technology. B
 
 """
 
+# splash image, decoded on first use (needs a QApplication to exist)
+_splash = None
+# scaled copies of the splash image, keyed by (width, height)
+_scaled = {}
+
+
+def _splash_pixmap(size):
+    """Return the splash image scaled to fit size (a QSize).
+    The jpg is only read and scaled once per size."""
+    global _splash
+    key = (size.width(), size.height())
+    try:
+        return _scaled[key]
+    except KeyError:
+        if _splash is None:
+            designer_dir = os.path.dirname(
+                    os.path.abspath(designer.__file__))
+            _splash = QtGui.QPixmap(os.path.join(designer_dir, 'splash.jpg'))
+        pix = _splash.scaled(size, QtCore.Qt.KeepAspectRatio)
+        _scaled[key] = pix
+        return pix
+
 class DisclaimerDialog(QtWidgets.QDialog):
 
     def __init__(self, parent=None):
@@ -26,10 +48,8 @@ class DisclaimerDialog(QtWidgets.QDialog):
         self.ui = Ui_Disclaimer()
         self.ui.setupUi(self)
      
-        designer_dir = os.path.dirname(os.path.abspath(designer.__file__))
-        image_dir = os.path.join(designer_dir, 'splash.jpg')
-        pix = QtGui.QPixmap(image_dir)
-        self.ui.splashImage.setPixmap(pix.scaled(self.ui.splashImage.size(),QtCore.Qt.KeepAspectRatio))
+        self.ui.splashImage.setPixmap(
+                _splash_pixmap(self.ui.splashImage.size()))
         self.ui.disclaimerText.setText(_(DISCLAIMER))
         
 
@@ -4,6 +4,7 @@
 
 
 import os
+from functools import partial
 from shamba.model import cfg
 
 from PyQt5 import QtCore, QtGui
@@ -30,13 +31,12 @@ class GeneralDialog(GenericDialog, Ui_general):
         self.setupUi(self)  # bare ui from designer
         
         self.buttons = NextBackButtons(
-                self.nextButton, self.backButton, self.stackedWidget)
+                self.nextButton, self.backButton, self.stackedWidget, self)
         
         # Make list of all the pages in the stackedWidget
         sw = self.stackedWidget
         sw.setCurrentIndex(0)
-        for w in [sw.widget(i) for i in range(sw.count())]:
-            self.pageList.append(w)
+        self.pageList = [sw.widget(i) for i in range(sw.count())]
         
         self._setup_overview_page()
         self._setup_param_page()
@@ -44,28 +44,15 @@ class GeneralDialog(GenericDialog, Ui_general):
         self._setup_climateTable_page()
         
         for p in self.pageList:
-            for par in self.parList:
-                if p not in par:
-                    par[p] = []
-            GenericPage(
-                    p, sw, self.buttons,
-                    toComplete=self.toComplete[p],
-                    toCompleteConditional=self.toCompleteConditional[p],
-                    toToggle=self.toToggle[p],
-                    buttonsToShowPage=self.buttonsToShowPage[p],
-                    buttonsToHidePage=self.buttonsToHidePage[p],
-                    buttonGroups=self.buttonGroups[p],
-                    comboBoxes=self.comBox[p]
-            )
+            GenericPage(p, sw, self.buttons, self.pageSpecs[p])
             
         # for help text
-        self.helpButton.clicked.connect(
-                lambda: self.show_help(sw.currentWidget())
-        )
+        self.helpButton.clicked.connect(self.show_current_help)
     
     def _setup_overview_page(self):
         p = self.overviewPage
-        self.toToggle[p] = {
+        spec = self.pageSpecs[p]
+        spec.toToggle = {
                 self.projectType: [self.farmerName, self.farmerNameLabel,
                                    self.fieldNumLabel, self.fieldNum,
                                    self.areaLabel, self.area, self.areaText]
@@ -77,7 +64,7 @@ class GeneralDialog(GenericDialog, Ui_general):
                 "at the individual field or project level."
         ))
 
-        self.toComplete[p] = [
+        spec.toComplete = [
                 (self.projectName, type(self.projectName))
         ]
     
@@ -97,12 +84,13 @@ class GeneralDialog(GenericDialog, Ui_general):
                 "climate benefit of the project intervention is assessed."
         ))
 
-        #self.toComplete[p] = [
+        #self.pageSpecs[p].toComplete = [
         #        self.latitude, self.longitude,
         #        self.modelYears, self.mitigationYears]
     
     def _setup_climate_page(self):
         p = self.climatePage
+        spec = self.pageSpecs[p]
         
         self.help_text[p] = _((
                 "SHAMBA default climate data is from the CRU-TS dataset. "
@@ -116,22 +104,23 @@ class GeneralDialog(GenericDialog, Ui_general):
                 "in a table on the next page."
         ))
 
-        self.buttonGroups[p] = [
+        spec.buttonGroups = [
                 [self.climFromCRU, self.climFromCsv, self.climFromCustom]]
-        self.toToggle[p] = {
+        spec.toToggle = {
                 self.climFromCsv: [self.climCsvLabel, self.climCsvBrowseBox,
                                    self.climCsvBrowseButton]
         }
-        self.toCompleteConditional[p] = [
+        spec.toCompleteConditional = [
                 (self.climCsvBrowseBox, type(self.climCsvBrowseBox),
                  self.climFromCsv)
         ]
         # file browser for climate
         self.climCsvBrowseButton.clicked.connect(
-                lambda: self.browse_for_file(self.climCsvBrowseBox))        
+                partial(self.browse_for_file, self.climCsvBrowseBox))
 
     def _setup_climateTable_page(self):
         p = self.climateTablePage
+        spec = self.pageSpecs[p]
         self.help_text[p] = _((
                 "Enter custom climate data in the table. "
                 "\n\n\"Which are you entering?\" Check the corresponding box "
@@ -139,10 +128,10 @@ class GeneralDialog(GenericDialog, Ui_general):
                 "evapotranspiration data in the third column. "
         ))
 
-        self.buttonGroups[p] = [
+        spec.buttonGroups = [
                 [self.openPanEvapCheck, self.evapotransCheck]]
-        self.buttonsToShowPage[p] = [self.climFromCustom]
-        self.buttonsToHidePage[p] = [self.climFromCRU, self.climFromCsv]
+        spec.buttonsToShowPage = [self.climFromCustom]
+        spec.buttonsToHidePage = [self.climFromCRU, self.climFromCsv]
         
          # Stuff for setting the text in the column labels        
         self.climateTable.horizontalHeaderItem(0).setText(
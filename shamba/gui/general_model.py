@@ -2,10 +2,7 @@
 
 import os
 import sys
-try:
-    from StringIO import StringIO ## for Python 2
-except ImportError:
-    from io import StringIO ## for Python 3
+from io import StringIO
 import logging as log
 import numpy as np
 from PyQt5 import QtCore, QtGui
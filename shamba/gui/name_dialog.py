@@ -16,14 +16,9 @@ class NameDialog(Ui_name, QtWidgets.QDialog):
             self.setWindowTitle(_("Intervention"))
 
         self.buttonBox.buttons()[0].setEnabled(False)
-        self.nameBox.textChanged.connect(
-                lambda: self._check_complete(self.nameBox.text())
-        )
+        self.nameBox.textChanged.connect(self._check_complete)
     
-    @QtCore.pyqtSlot()
+    @QtCore.pyqtSlot(str)
     def _check_complete(self, text):
-       
-        if len(str(text).strip()) > 0:
-            self.buttonBox.buttons()[0].setEnabled(True)
-        else:
-            self.buttonBox.buttons()[0].setEnabled(False)
+        # complete when name isn't blank (or just spaces)
+        self.buttonBox.buttons()[0].setEnabled(bool(text.strip()))
@@ -45,13 +45,9 @@ class NextBackButtons(QtCore.QObject):
         self.nextButton.clicked.connect(self.goToNextPage)
         self.backButton.clicked.connect(self.goToPrevPage)
         
-        # Each widget in the stack must have a dict of bools named complete
-        # as an attribute so that buttons can be disabled/enabled
-        self.stack.currentChanged.connect(
-            lambda: self.enableButtons(all(
-                self.stack.currentWidget().complete.isComplete.values()
-                ))
-        )
+        # Each widget in the stack must have a PageComplete object named
+        # complete as an attribute so that buttons can be disabled/enabled
+        self.stack.currentChanged.connect(self._enable_for_current_page)
         self.enableButtons(True)
     
     def disconnectSlots(self):
@@ -63,6 +59,11 @@ class NextBackButtons(QtCore.QObject):
         self.backButton.clicked.disconnect()
         self.stack.currentChanged.disconnect()
 
+    @QtCore.pyqtSlot(int)
+    def _enable_for_current_page(self, index):
+        """Enable/disable buttons for the page the stack changed to."""
+        self.enableButtons(self.stack.currentWidget().complete.is_all_complete)
+
     @QtCore.pyqtSlot(bool)
     def enableButtons(self, isComplete):
         """
@@ -162,12 +163,14 @@ class PageComplete(QtWidgets.QWidget):
         self.toComplete = toComplete
         self.toCompleteConditional = toCompleteConditional
 
-        # Store completeness bools for each widget 
+        # Store completeness bools for each widget, along with a running
+        # count of the incomplete ones so the page state is O(1) to query
         self.isComplete = {}
+        self._incomplete_count = 0
         for widget,type in toComplete:
-            self.isComplete[widget] = False
+            self._set_complete(widget, False)
         for widget,type,button in toCompleteConditional:
-            self.isComplete[widget] = True
+            self._set_complete(widget, True)
         
         # connect signals and slots for toComplete
         self.connect_widgets()
@@ -176,52 +179,71 @@ class PageComplete(QtWidgets.QWidget):
        
         # Enable buttons - start on title page
         self.buttons.enableButtons(True)
+
+    @property
+    def is_all_complete(self):
+        """True if every required widget on the page is complete."""
+        return self._incomplete_count == 0
+
+    def _set_complete(self, widget, complete):
+        """Set completeness of widget, keeping the count of
+        incomplete widgets up to date.
+        """
+        wasComplete = self.isComplete.get(widget, True)
+        if wasComplete and not complete:
+            self._incomplete_count += 1
+        elif complete and not wasComplete:
+            self._incomplete_count -= 1
+        self.isComplete[widget] = complete
     
     def connect_widgets(self, connectBool=True):
         """
-        Create dict with the signal and slot combo for each item 
-        on the toComplete list.
+        Connects the signals/slots so that when each item on the 
+        toComplete list is changed (e.g. valueChanged, buttonClicked, etc.),
+        the item can be marked as 'complete'. 
+
+        connectBool=True if to be connect, False if to be disconnected"""
+        for widget,type in self.toComplete:
+            self._connect_widget(widget, type, connectBool)
+
+    def _connect_widget(self, widget, type, connectBool=True):
+        """
+        Connect (or disconnect) the signal and slot combo for a single
+        item on the toComplete list.
         e.g. a QSpinBox will have signal=valueChanged, 
                 slot=_check_complete_spinbox
 
-        Connects the signals/slots so that when the item is changed
-        (e.g. valueChanged, buttonClicked, etc.), the item can be marked
-        as 'complete'. 
-
-        connectBool=True if to be connect, False if to be disconnected"""
+        Only the completeness slot is disconnected so any other 
+        connections to the signal (e.g. for toggling) are left alone.
+        """
         # Store what signal and slot to use for particular type
-
-        def signal(widget, type):
-            # Returns the signal name (callable) and the args to emit
-            if type == QtWidgets.QLineEdit:
-                sig = widget.textChanged
-                emit = widget.text()
-            elif type == QtWidgets.QSpinBox or type == QtWidgets.QDoubleSpinBox:
-                sig = widget.valueChanged
-                emit = widget.value()
-            elif type == QtWidgets.QButtonGroup:
-                sig = widget.buttonClicked
-                emit = widget.checkedButton()
-            elif type == QtWidgets.QComboBox:
-                sig = widget.currentIndexChanged
-                emit = widget.currentIndex()
-            return sig, emit
-        slot = {
-                QtWidgets.QLineEdit: self._check_complete_QLineEdit,
-                QtWidgets.QSpinBox: self._check_complete_QSpinBox,
-                QtWidgets.QDoubleSpinBox: self._check_complete_QDoubleSpinBox,
-                QtWidgets.QButtonGroup: self._check_complete_QButtonGroup,
-                QtWidgets.QComboBox: self._check_complete_QComboBox
-        }
+        # signal is the signal name (callable) and the args to emit
+        if type == QtWidgets.QLineEdit:
+            sig = widget.textChanged
+            emit = widget.text()
+            slot = self._check_complete_QLineEdit
+        elif type == QtWidgets.QSpinBox:
+            sig = widget.valueChanged
+            emit = widget.value()
+            slot = self._check_complete_QSpinBox
+        elif type == QtWidgets.QDoubleSpinBox:
+            sig = widget.valueChanged
+            emit = widget.value()
+            slot = self._check_complete_QDoubleSpinBox
+        elif type == QtWidgets.QButtonGroup:
+            sig = widget.buttonClicked
+            emit = widget.checkedButton()
+            slot = self._check_complete_QButtonGroup
+        elif type == QtWidgets.QComboBox:
+            sig = widget.currentIndexChanged
+            emit = widget.currentIndex()
+            slot = self._check_complete_QComboBox
         
-        # Connect signals and slots for checking completeness
-        for widget,type in self.toComplete:
-            sig = signal(widget,type)
-            if connectBool:
-                sig[0].connect(slot[type])
-                sig[0].emit(sig[1])
-            else:
-                sig[0].disconnect()
+        if connectBool:
+            sig.connect(slot)
+            sig.emit(emit)
+        else:
+            sig.disconnect(slot)
 
     def _toggle_toComplete(self, checked):
         """
@@ -229,21 +251,24 @@ class PageComplete(QtWidgets.QWidget):
         whether or not they need to be completed
         (based on if the conditional button is toggled)
 
+        Connections for the rest of the page are kept as they are -
+        only the widgets toggled by the sender() are (dis)connected.
         """
-        self.connect_widgets(False)
-
         # iterate over tuples that have sender() in them
         for widget,type,button in [
                 x for x in self.toCompleteConditional if self.sender() in x]:
             if checked:
-                self.toComplete.append((widget,type))
+                if (widget,type) not in self.toComplete:
+                    self.toComplete.append((widget,type))
+                    self._connect_widget(widget, type, True)
             else:
                 try:
                     self.toComplete.remove((widget,type))
-                    self.isComplete[widget] = True
+                    self._connect_widget(widget, type, False)
+                    self._set_complete(widget, True)
                 except ValueError:  # not in list
                     pass
-        self.connect_widgets(True)
+        self.buttons.enableButtons(self.is_all_complete)
         
     # Slots to check completeness of various types of objects
     def _check_complete_QLineEdit(self, text):
@@ -251,13 +276,13 @@ class PageComplete(QtWidgets.QWidget):
         complete when changed to a non-blank value
         """
         # Check if lineEdit itself is actually done
-        if len(str(text).strip()) == 0:
+        if not text.strip():
             # line is blank (strip accounts for lines with just spaces)
-            self.isComplete[self.sender()] = False
+            self._set_complete(self.sender(), False)
             self.buttons.enableButtons(False)
         else:
-            self.isComplete[self.sender()] = True
-            self.buttons.enableButtons(all(self.isComplete.values()))
+            self._set_complete(self.sender(), True)
+            self.buttons.enableButtons(self.is_all_complete)
      
     def _check_complete_QDoubleSpinBox(self, value):
         """Check completeness of a QDoubleSpinBox - 
@@ -265,22 +290,22 @@ class PageComplete(QtWidgets.QWidget):
         """
         if math.fabs(value) < 0.00000001:
             # sufficiently close to 0
-            self.isComplete[self.sender()] = False
+            self._set_complete(self.sender(), False)
             self.buttons.enableButtons(False)
         else:
-            self.isComplete[self.sender()] = True
-            self.buttons.enableButtons(all(self.isComplete.values()))
+            self._set_complete(self.sender(), True)
+            self.buttons.enableButtons(self.is_all_complete)
    
     def _check_complete_QSpinBox(self, value):
         """Check completeness of a QSpinBox - 
         complete when changed to non-zero value
         """
         if value == 0:
-            self.isComplete[self.sender()] = False
+            self._set_complete(self.sender(), False)
             self.buttons.enableButtons(False)
         else:
-            self.isComplete[self.sender()] = True
-            self.buttons.enableButtons(all(self.isComplete.values()))
+            self._set_complete(self.sender(), True)
+            self.buttons.enableButtons(self.is_all_complete)
     
     def _check_complete_QButtonGroup(self, buttonPressed):
         """Check completeness of a QButtonGroup - 
@@ -289,8 +314,8 @@ class PageComplete(QtWidgets.QWidget):
         if buttonPressed is None:  # no button checked when buttonClicked
             return              # emitted
         
-        self.isComplete[self.sender()] = True
-        self.buttons.enableButtons(all(self.isComplete.values()))
+        self._set_complete(self.sender(), True)
+        self.buttons.enableButtons(self.is_all_complete)
         
     def _check_complete_QComboBox(self, index):
         """Check completeness of a QComboBox - 
@@ -298,9 +323,9 @@ class PageComplete(QtWidgets.QWidget):
         (make sure index 0 is always a title)
         """
         if index == 0:
-            self.isComplete[self.sender()] = False
+            self._set_complete(self.sender(), False)
             self.buttons.enableButtons(False)
         else:
-            self.isComplete[self.sender()] = True
-            self.buttons.enableButtons(all(self.isComplete.values()))
+            self._set_complete(self.sender(), True)
+            self.buttons.enableButtons(self.is_all_complete)
 
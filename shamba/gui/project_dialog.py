@@ -5,6 +5,8 @@
 
 
 import os
+from collections import namedtuple
+from functools import partial
 from shamba.model import cfg
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -14,34 +16,168 @@ from shamba.gui.page_change import NextBackButtons
 from shamba.gui.dialog_setup import GenericDialog, GenericPage
 
 
+# Widgets on the tree thinning page for one species
+ThinWidgets = namedtuple(
+        'ThinWidgets',
+        'never interval custom line freq amount stems_left branches_left')
+
+# Validator regex for line edits which need a list/range of years
+YEARS_REGEXP = QtCore.QRegExp("^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$")
+
 # Rich-text for the title page - set to baseline text by default, but set
 # text programmatically to these if !isBaseline
+# (kept to minimal markup so there is little for the labels to parse)
+# NOTE: these and the help texts below are untranslated source strings -
+# they're passed through _() when used, once a translator can be installed
+
+INTERVENTION_TITLE_TEXT = (
+        "<p style=\"font-size:18pt; font-weight:600;\">NEW INTERVENTION</p>"
+)
+
+INTERVENTION_SUBTITLE_TEXT = (
+        "<p style=\"font-size:14pt;\">"
+        "The following screens will prompt you to enter <br />"
+        "information about the farming activities that make <br />"
+        "up the intervention</p>"
+)
+
+INTERVENTION_END_TITLE_TEXT = (
+        "<p style=\"font-size:18pt; font-weight:600;\">"
+        "END OF NEW INTERVENTION</p>"
+)
+
+# Help text for each page (translated by show_help)
+
+# (%(type)s is the kind of scenario, so translators see the whole text)
+MGMT_INFO_HELP = (
+        "Use this screen to enter details of the number of species "
+        "planted and external inputs added in the %(type)s. "
+        "\n\nA maximum of 10 crop species and 10 tree species can "
+        "be entered for each %(type)s. "
+        "\n\nOrganic inputs are plant or animal material that is "
+        "added to the field. Different types of organic input "
+        "include leaf litter, mulch and manure. "
+        "Each %(type)s can include a maximum of 2 types of "
+        "organic inputs."
+        "\n\nSynthetic fertilisers include any inorganic material "
+        "added to the soil to improve plant growth. Different types "
+        "of synthetic fertiliser are those with different "
+        "proportions of the macronutrients - Nitrogen (N), "
+        "Phosphorus (P) and Potassium (K). A maximum of 2 types of "
+        "synthetic fertiliser can be included in each %(type)s. "
+)
+
+SOIL_HELP = (
+        "SHAMBA default soil data is from the Harmonised World "
+        "Soil Database. Using the default data is recommended "
+        "for most users, unless high quality soil data are "
+        "available from a local survey."
+        "\n\nIf you choose to load soil data, the file must be in "
+        ".csv format and match the format of the sample soil file "
+        "(found in shamba/sample_input_files/soilInfo.csv). "
+        "\n\nIf you choose to directly enter data, enter the carbon "
+        "and clay content of the soil in the boxes that appear. "
+)
 
-INTERVENTION_TITLE_TEXT = _(
-        "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">"
-        "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">"
-        "p, li { white-space: pre-wrap; }"
-        "</style></head><body style=\" font-family:'Sans'; font-size:10pt; font-weight:400; font-style:normal;\">"
-        "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:18pt; font-weight:600;\">NEW INTERVENTION</span></p></body></html>"
+SOIL_MGMT_HELP = (
+        "Tick the boxes for the months (if any) when soil is "
+        "covered or partially covered by crops, crop residues or "
+        "other vegetation. Leave the box empty if the soil is left "
+        "bare for that month."
+        "\n\nIf the field if periodically burned to clear vegetation "
+        "or crop residues, or by naturally occurring fires, enter "
+        "the frequency of burning. Or if burning is irregular, enter "
+        "the years when burning is expected to occur."
 )
 
-INTERVENTION_SUBTITLE_TEXT = _(
-        "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">"
-        "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">"
-        "p, li { white-space: pre-wrap; }"
-        "</style></head><body style=\" font-family:'Sans'; font-size:10pt; font-weight:400; font-style:normal;\">"
-        "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:14pt;\">The following screens will prompt you to enter </span></p>"
-        "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:14pt;\">information about the farming activities that make </span></p>"
-        "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:14pt;\">up the intervention</span></p></body></html>"      
+CROP_MGMT_HELP = (
+        "For each planted crop, select the species from the drop "
+        "down menu or, if the specific species is not listed, "
+        "choose the closest generic type. Then enter the "
+        "typical yield in tonnes of dry matter and the "
+        "percentage of crop residues that are left in the field "
+        "after harvest. If crop residues are removed from the "
+        "field, select a button to indicate whether they are "
+        "burned."
 )
 
-INTERVENTION_END_TITLE_TEXT = _(
-       "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">"
-        "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">"
-        "p, li { white-space: pre-wrap; }"
-        "</style></head><body style=\" font-family:'Sans'; font-size:10pt; font-weight:400; font-style:normal;\">"
-        "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:18pt; font-weight:600;\">END OF NEW INTERVENTION</span></p></body></html>"
-) 
+TREE_MGMT_HELP = (
+        "For each tree species planted, specify the type of "
+        "species, planting density and year when planting is "
+        "carried out (i.e. year 0 if trees are planted at "
+        "the start of the project period)."
+)
+
+TREE_THIN_HELP = (
+        "For each tree species planted, specify if and when "
+        "thinning or harvest is planned. If trees will be "
+        "thinned or harvested, specify the percentage of trees "
+        "that will be felled during each thinning or harvest "
+        "event, and the percentage of stem and branch biomass "
+        "that will be left in the field."
+)
+
+TREE_MORT_HELP = (
+        "For each tree species planted, specify the expected "
+        "mortality rate (excluding felled trees), and the "
+        "percentage of dead stem and branch biomass removed "
+        "from the field."
+)
+
+TREE_GROWTH_HELP = (
+        "For each tree species planted, load a growth data "
+        "file and choose an appropriate allometric model for "
+        "estimating total tree biomass. Choose the most "
+        "appropriate model for the project area from the list "
+        "of models provided."
+        "\n\nThe growth file must be in .csv format and match "
+        "the format of the sample growth file (found in "
+        "shamba/sample_input_files/growth.csv)."
+)
+
+LITTER_HELP = (
+        "If organic inputs such as litter, mulch or manure that "
+        "originate outside the field are added to the field, "
+        "specify how often these inputs are added, and the "
+        "approximate dry weight of each application."
+        "\n\nIf no organic inputs are added, go back to the "
+        "first screen and set the number of kinds of external "
+        "organic inputs added to zero."
+)
+
+FERT_HELP = (
+        "If synthetic fertilisers are added to the field, "
+        "specify how often these are added, the approximate "
+        "amount added for each application, and the nitrogen "
+        "content of the fertiliser."
+        "\n\nIf the fertiliser used has an NPK rating on the "
+        "packaging (e.g. 16-4-8), the first number in the "
+        "sequence is the percentage nitrogen (e.g. 16% in this "
+        "example)."
+        "\n\nIf no synthetic fertilisers are added, go back to "
+        "the first screen and set the number of kinds of "
+        "synthetic fertiliser added to zero."
+)
+
+# Names (%d is the species number) of the extra widgets shown/hidden
+# on each per-species page
+CROP_TOGGLE_NAMES = (
+        "cropCsvLabel_%d", "cropInputType_%d", "cropCsvBrowseBox_%d",
+        "cropCsvBrowseButton_%d", "cropCustomButton_%d", "cropCsvButton_%d",
+)
+TREE_TOGGLE_NAMES = (
+        "treeInputType_%d", "treeCsvButton_%d", "treeCustomButton_%d",
+        "treeCsvLabel_%d", "treeCsvBrowseBox_%d", "treeCsvBrowseButton_%d",
+)
+THIN_TOGGLE_NAMES = (
+        "treesThinnedText_%d", "treesThinnedLabel_%d", "thinnedLeftText_%d",
+        "thinnedStemsLeftText_%d", "thinnedStemsLeftLabel_%d",
+        "thinnedBranchesLeftText_%d", "thinnedBranchesLeftLabel_%d",
+)
+MORT_TOGGLE_NAMES = (
+        "deadLeftText_%d", "deadStemsLeftText_%d", "deadStemsLeftLabel_%d",
+        "deadBranchesLeftText_%d", "deadBranchesLeftLabel_%d",
+)
 
 class ProjectDialog(GenericDialog, Ui_project):
     
@@ -57,143 +193,221 @@ class ProjectDialog(GenericDialog, Ui_project):
 
     def __init__(self, isBaseline=True, parent=None):
         super(ProjectDialog, self).__init__(parent)
+        self.isBaseline = isBaseline
+
+        # ui is set up when the dialog is first shown - see initialize
+        self._initialized = False
+
+    def setVisible(self, visible):
+        """
+        Override setVisible so that the dialog is initialised just
+        before it is first shown (show() and exec_() both call this).
+        """
+        if visible:
+            self.initialize()
+        super(ProjectDialog, self).setVisible(visible)
+
+    def initialize(self):
+        """
+        Set up the ui from designer and the pages of the stackedWidget.
+        Only does anything the first time it is called.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+
         self.setupUi(self)  # bare ui from designer
-        
 
         # change some labels if it's not baseline
-        self.isBaseline = isBaseline
         if not self.isBaseline:
-            self.title_label.setText(INTERVENTION_TITLE_TEXT)
-            self.subtitle_label.setText(INTERVENTION_SUBTITLE_TEXT)
-            self.end_title_label.setText(INTERVENTION_END_TITLE_TEXT)
+            self.title_label.setText(_(INTERVENTION_TITLE_TEXT))
+            self.subtitle_label.setText(_(INTERVENTION_SUBTITLE_TEXT))
+            self.end_title_label.setText(_(INTERVENTION_END_TITLE_TEXT))
             self.setWindowTitle(_("Define Intervention"))    
 
         self.buttons = NextBackButtons(
-                self.nextButton, self.backButton, self.stackedWidget)
+                self.nextButton, self.backButton, self.stackedWidget, self)
+
+        # Hold off repainting until all the pages have been set up
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_pages()
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # help dialog
+        self.helpButton.clicked.connect(self.show_current_help)
+
+        # rearrange every time page is finished so that it is right
+        # (connected to a bound method rather than a partial so PyQt drops
+        # the connection when the dialog is destroyed)
+        self.buttons.finishedPage.connect(self._sort_page_list)
 
+    def _setup_pages(self):
+        """Set up all the pages of the stackedWidget."""
         # Make list of all the pages in the stackedWidget
         sw = self.stackedWidget
         sw.setCurrentIndex(0)
-        for w in [sw.widget(i) for i in range(sw.count())]:
-            self.pageList.append(w) 
+        self.pageList = [sw.widget(i) for i in range(sw.count())]
        
+        # one validator is shared by all the year list line edits
+        self._years_validator = QtGui.QRegExpValidator(YEARS_REGEXP, self)
+
         self._setup_mgmtInfo_page()
         self._setup_soil_page()
         self._setup_soilMgmt_page()
-        self._setup_cropMgmt_pages()
-        self._setup_treeMgmt_pages()
-        self._setup_treeThin_pages()
-        self._setup_treeMort_pages()
-        self._setup_treeGrowth_pages()
-        self._setup_litter_pages()
-        self._setup_fert_pages()
 
-        for p in self.pageList:
-            for par in self.parList:
-                if p not in par:
-                    par[p] = []
-            GenericPage(
-                    p, sw, self.buttons,
-                    toComplete=self.toComplete[p],
-                    toCompleteConditional=self.toCompleteConditional[p],
-                    toToggle=self.toToggle[p],
-                    buttonsToShowPage=self.buttonsToShowPage[p],
-                    buttonsToHidePage=self.buttonsToHidePage[p],
-                    spinboxesToShowPage=self.spinboxesToShowPage[p],
-                    buttonGroups=self.buttonGroups[p],
-                    comboBoxes=self.comBox[p]
-            )
-        
-        # toggle the mort amount box a couple times so that
-        # the fields on that page are shown correctly
-        pages = [
-                self.findChild(QtWidgets.QWidget, "treeMortPage_"+str(i))
-                for i in range(self.treeNum.maximum())
-        ]
-        for i, p in enumerate(pages):
-            mort_rate_box = p.findChild(QtWidgets.QSpinBox, "treesDead_"+str(i))
-            mort_rate_box.setValue(0)
-            mort_rate_box.setValue(1)
+        # Per-species pages (and their lists of widgets) are only set up
+        # when the number of species on the info page is high enough
+        # for them to be shown. Pages for each spinbox are set up in order
+        # so list indices match the species number.
+        self._species_pages = {
+                self.cropNum: [
+                        ("cropMgmtPage_", self._setup_cropMgmt_page)],
+                self.treeNum: [
+                        ("treeMgmtPage_", self._setup_treeMgmt_page),
+                        ("treeThinPage_", self._setup_treeThin_page),
+                        ("treeMortPage_", self._setup_treeMort_page),
+                        ("treeGrowthPage_", self._setup_treeGrowth_page)],
+                self.litterNum: [
+                        ("litterPage_", self._setup_litter_page)],
+                self.fertNum: [
+                        ("fertPage_", self._setup_fert_page)],
+        }
+        self._page_setup_done = {}  # number of pages set up for each spinbox
 
-        # help dialog
-        self.helpButton.clicked.connect(
-                lambda: self.show_help(sw.currentWidget())
-        )
+        self.crop_type, self.crop_yield, self.crop_leftinfield = [], [], []
+        self.crop_burnno, self.crop_burnyes  = [], []
+        
+        self.tree_name,self.tree_type = [],[]
+        self.tree_standdens,self.tree_yearplanted  = [],[]
+        
+        self.thin_pages = []    # ThinWidgets for each tree species
+        
+        self.mort_amount = []
+        self.mort_stemsleft, self.mort_branchesleft = [], []
+        
+        self.growth_csvbut, self.growth_custombut = [], []
+        self.growth_csvline, self.growth_allom = [], []
+        
+        self.litter_input = []
+        self.litter_freq = []
+        self.litter_customline = []
+        self.litter_intervalbut = []
+        self.litter_custombut = []
+        
+        self.fert_input = []
+        self.fert_nitrogen = []
+        self.fert_freq = []
+        self.fert_customline = []
+        self.fert_intervalbut = []
+        self.fert_custombut = []
 
-        # rearrange every time page is finished so that it is right
-        self.buttons.finishedPage.connect(
-                lambda: self.sort_pages(sw, self.pageList)
+        # Species pages which aren't needed yet are taken out of the stack,
+        # and kept by name so they needn't be searched for later
+        speciesPrefixes = tuple(
+                prefix for pages in self._species_pages.values()
+                for prefix, setup in pages
         )
+        self._speciesPageByName = {}
+        for p in self.pageList:
+            name = str(p.objectName())
+            if name.startswith(speciesPrefixes):
+                self._speciesPageByName[name] = p
+                sw.removeWidget(p)
+            else:
+                self._setup_generic_page(p)
+
+        for spinbox in self._species_pages:
+            self._setup_species_pages(spinbox, spinbox.value())
+            spinbox.valueChanged.connect(
+                    partial(self._setup_species_pages, spinbox))
+
+    @QtCore.pyqtSlot(QtWidgets.QWidget)
+    def _sort_page_list(self, finishedPage=None):
+        """Put the pages of the stackedWidget in the order of pageList."""
+        self.sort_pages(self.stackedWidget, self.pageList)
+
+    def _setup_generic_page(self, p):
+        """Make the GenericPage for page p from its PageSpec."""
+        GenericPage(p, self.stackedWidget, self.buttons, self.pageSpecs[p])
+
+    def _setup_species_pages(self, spinbox, num):
+        """
+        Set up the per-species pages shown by spinbox for the first
+        num species, if that hasn't been done already.
+
+        Slot connected to the valueChanged signal of spinbox.
+        """
+        done = self._page_setup_done.get(spinbox, 0)
+        if num <= done:
+            return
+
+        # Hold off repainting the stack until the new pages are set up
+        # (unless updates are already held off, e.g. in initialize)
+        sw = self.stackedWidget
+        deferUpdates = sw.updatesEnabled()
+        if deferUpdates:
+            sw.setUpdatesEnabled(False)
+        try:
+            for i in range(done, num):
+                for prefix, setup in self._species_pages[spinbox]:
+                    p = self._speciesPageByName[prefix+str(i)]
+                    setup(i, p)
+                    self._setup_generic_page(p)
+            self._page_setup_done[spinbox] = num
+
+            # new pages are added to the end of the stack, so put them
+            # back in the right place
+            self._sort_page_list()
+        finally:
+            if deferUpdates:
+                sw.setUpdatesEnabled(True)
          
+    @staticmethod
+    def _resolve(names, templates, i):
+        """Return the widgets in names for each of the templates
+        filled in with species number i.
+        """
+        return [names[tpl % i] for tpl in templates]
+
     def _setup_mgmtInfo_page(self):
         p = self.infoPage
 
+        # translated here since the filled-in text isn't a translation key
         if self.isBaseline:
-            type = "baseline scenario"
+            type = _("baseline scenario")
         else:
-            type = "intervention"
-        self.help_text[p] = _((
-                "Use this screen to enter details of the number of species "
-                "planted and external inputs added in the " + type + ". "
-                "\n\nA maximum of 10 crop species and 10 tree species can "
-                "be entered for each " + type + ". "
-                "\n\nOrganic inputs are plant or animal material that is "
-                "added to the field. Different types of organic input "
-                "include leaf litter, mulch and manure. "
-                "Each " + type + " can include a maximum of 2 types of "
-                "organic inputs."
-                "\n\nSynthetic fertilisers include any inorganic material "
-                "added to the soil to improve plant growth. Different types "
-                "of synthetic fertiliser are those with different "
-                "proportions of the macronutrients - Nitrogen (N), "
-                "Phosphorus (P) and Potassium (K). A maximum of 2 types of "
-                "synthetic fertiliser can be included in each " + type + ". "
-        ))
+            type = _("intervention")
+        self.help_text[p] = _(MGMT_INFO_HELP) % {"type": type}
 
     def _setup_soil_page(self):
         p = self.soilPage
+        spec = self.pageSpecs[p]
         
-        self.help_text[p] = _((
-                "SHAMBA default soil data is from the Harmonised World "
-                "Soil Database. Using the default data is recommended "
-                "for most users, unless high quality soil data are "
-                "available from a local survey."
-                "\n\nIf you choose to load soil data, the file must be in "
-                ".csv format and match the format of the sample soil file "
-                "(found in shamba/sample_input_files/soilInfo.csv). "
-                "\n\nIf you choose to directly enter data, enter the carbon "
-                "and clay content of the soil in the boxes that appear. "
-        ))
-
-        self.buttonGroups[p] = [
+        self.help_text[p] = SOIL_HELP
+
+        spec.buttonGroups = [
                 [self.soilFromHWSD, self.soilFromCsv, self.soilFromCustom]]
-        self.toToggle[p] = {
+        spec.toToggle = {
                 self.soilFromCustom: [self.Cy0Input, self.clayInput,
                                       self.soilCy0Label, self.soilClayLabel,
                                       self.soilCy0Unit, self.soilClayUnit],
                 self.soilFromCsv: [self.soilCsvLabel, self.soilCsvBrowseBox,
                                    self.soilCsvBrowseButton]
         }
-        self.toCompleteConditional[p] = [
+        spec.toCompleteConditional = [
             (self.soilCsvBrowseBox, type(self.soilCsvBrowseBox),
                 self.soilFromCsv),
         ]
         # File browser
         self.soilCsvBrowseButton.clicked.connect(
-                lambda: self.browse_for_file(self.soilCsvBrowseBox)) 
+                partial(self.browse_for_file, self.soilCsvBrowseBox))
 
     def _setup_soilMgmt_page(self):
         p = self.soilMgmtPage
-        self.help_text[p] = _((
-                "Tick the boxes for the months (if any) when soil is "
-                "covered or partially covered by crops, crop residues or "
-                "other vegetation. Leave the box empty if the soil is left "
-                "bare for that month."
-                "\n\nIf the field if periodically burned to clear vegetation "
-                "or crop residues, or by naturally occurring fires, enter "
-                "the frequency of burning. Or if burning is irregular, enter "
-                "the years when burning is expected to occur."
-        ))
+        spec = self.pageSpecs[p]
+        self.help_text[p] = SOIL_MGMT_HELP
 
         self.coverFields = [
                 self.janCover, self.febCover, self.marCover,
@@ -201,550 +415,326 @@ class ProjectDialog(GenericDialog, Ui_project):
                 self.julCover, self.augCover, self.sepCover,
                 self.octCover, self.novCover, self.decCover,
         ]
-        self.buttonGroups[p] = [
+        spec.buttonGroups = [
                 [self.fireNever, self.fireInterval, self.fireCustom],
         ]
 
-        self.toToggle[p] = {
+        spec.toToggle = {
                 self.fireCustom: [self.fireCustomText,
                                        self.fireCustomLine]
         }
-        self.toCompleteConditional[p] = [
+        spec.toCompleteConditional = [
                 (self.fireCustomLine, type(self.fireCustomLine),
                  self.fireCustom)
         ]
         
         # Validator for the line edit which needs a list/range of years
-        reg_exp = "^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$"
-        val = QtGui.QRegExpValidator(QtCore.QRegExp(reg_exp), self)
-        self.fireCustomLine.setValidator(val)
+        self.fireCustomLine.setValidator(self._years_validator)
         
         # setup what the "select all" box does
         self.allCover.stateChanged.connect(self._toggle_cover_fields)
 
+    @QtCore.pyqtSlot(int)
     def _toggle_cover_fields(self, checkState):
         # if selectAll was changed from notSelected to selected,
-        # check all the fields
-        if checkState == QtCore.Qt.Checked:
-            for f in self.coverFields:
-                f.setChecked(True)
-        if checkState == QtCore.Qt.Unchecked:
-            for f in self.coverFields:
-                f.setChecked(False)
-
-    def _setup_cropMgmt_pages(self):
-        
-        pages = []
-        pages = [
-                self.findChild(QtWidgets.QWidget, "cropMgmtPage_"+str(i))
-                for i in range(self.cropNum.maximum())
-        ]       
-        # store lists of widgets
-        self.crop_type, self.crop_yield, self.crop_leftinfield = [], [], []
-        self.crop_burnno, self.crop_burnyes  = [], []
+        # check all the fields (and uncheck them if the other way round)
+        if checkState not in (QtCore.Qt.Checked, QtCore.Qt.Unchecked):
+            return
+        checked = checkState == QtCore.Qt.Checked
 
-        for i, p in enumerate(pages):
-            
-            # help text to show
-            self.help_text[p] = _((
-                    "For each planted crop, select the species from the drop "
-                    "down menu or, if the specific species is not listed, "
-                    "choose the closest generic type. Then enter the "
-                    "typical yield in tonnes of dry matter and the "
-                    "percentage of crop residues that are left in the field "
-                    "after harvest. If crop residues are removed from the "
-                    "field, select a button to indicate whether they are "
-                    "burned."
-            ))
-
-            # make widget lists
-            self.crop_type.append(
-                    p.findChild(QtWidgets.QComboBox, "cropType_"+str(i))
-            )
-            self.crop_yield.append(
-                    p.findChild(QtWidgets.QDoubleSpinBox, "cropYield_"+str(i))
-            )
-            self.crop_leftinfield.append(
-                    p.findChild(QtWidgets.QSpinBox, "leftInField_"+str(i))
-            )
-            self.crop_burnyes.append(
-                    p.findChild(QtWidgets.QRadioButton, "cropBurnYes_"+str(i))
-            )
-            self.crop_burnno.append(
-                    p.findChild(QtWidgets.QRadioButton, "cropBurnNo_"+str(i))
-            )            
-
-
-            # complete and combobox
-            self.toComplete[p] = [
-                    (self.crop_type[i],type(self.crop_type[i]))]
-            self.comBox[p] = {self.crop_type[i]: [0,1,2,19,20,29,30,31]}
-
-            # toggle
-            toggle_lst = [
-                    p.findChild(QtWidgets.QLabel, "cropCsvLabel_"+str(i)),
-                    p.findChild(QtWidgets.QLabel, "cropInputType_"+str(i)),
-                    p.findChild(QtWidgets.QLineEdit, "cropCsvBrowseBox_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QPushButton, "cropCsvBrowseButton_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QRadioButton, "cropCustomButton_"+str(i)),
-                    p.findChild(QtWidgets.QRadioButton, "cropCsvButton_"+str(i)),
-            ]
-            self.toToggle[p] = {self.crop_type[i]: toggle_lst}
-            
-            # show/hide page
-            self.spinboxesToShowPage[p] = [(self.cropNum, i+1)]
-            
-            # button groups
-            self.buttonGroups[p] = [
-                    [self.crop_burnyes[i], self.crop_burnno[i]]]
+        # nothing listens to the individual months, so their signals 
+        # are blocked, and the page is repainted once at the end
+        p = self.soilMgmtPage
+        p.setUpdatesEnabled(False)
+        for f in self.coverFields:
+            blocker = QtCore.QSignalBlocker(f)
+            f.setChecked(checked)
+            blocker.unblock()
+        p.setUpdatesEnabled(True)
+
+    def _setup_cropMgmt_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        # help text to show
+        self.help_text[p] = CROP_MGMT_HELP
+
+        # make widget lists
+        self.crop_type.append(
+                names["cropType_%d" % i]
+        )
+        self.crop_yield.append(
+                names["cropYield_%d" % i]
+        )
+        self.crop_leftinfield.append(
+                names["leftInField_%d" % i]
+        )
+        self.crop_burnyes.append(
+                names["cropBurnYes_%d" % i]
+        )
+        self.crop_burnno.append(
+                names["cropBurnNo_%d" % i]
+        )            
 
-    def _setup_treeMgmt_pages(self):
-        
-        pages = [
-                self.findChild(QtWidgets.QWidget, "treeMgmtPage_"+str(i))
-                for i in range(self.treeNum.maximum())
-        ]
-        self.tree_name,self.tree_type = [],[]
-        self.tree_standdens,self.tree_yearplanted  = [],[]
 
-        for i, p in enumerate(pages):
-            
-            self.help_text[p] = _((
-                    "For each tree species planted, specify the type of "
-                    "species, planting density and year when planting is "
-                    "carried out (i.e. year 0 if trees are planted at "
-                    "the start of the project period)."
-            ))
-
-            # list of widgets
-            self.tree_name.append(
-                    p.findChild(QtWidgets.QLineEdit, "speciesName_"+str(i))
-            )
-            self.tree_type.append(
-                    p.findChild(QtWidgets.QComboBox, "treeType_"+str(i))
-            )
-            self.tree_standdens.append(
-                    p.findChild(QtWidgets.QSpinBox, "standDens_"+str(i))
-            )
-            self.tree_yearplanted.append(
-                    p.findChild(QtWidgets.QSpinBox, "yearPlanted_"+str(i))
-            )
-            
-            self.toComplete[p] = [
-                    (self.tree_type[i], type(self.tree_type[i]))
-            ]
-            self.comBox[p] = {self.tree_type[i]: [0,1,2,4,5,6]}
-
-            # toggle
-            toggle_lst = [
-                    p.findChild(QtWidgets.QLabel, "treeInputType_"+str(i)),
-                    p.findChild(QtWidgets.QRadioButton, "treeCsvButton_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QRadioButton, "treeCustomButton_"+str(i)),
-                    p.findChild(QtWidgets.QLabel, "treeCsvLabel_"+str(i)),
-                    p.findChild(QtWidgets.QLineEdit, "treeCsvBrowseBox_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QPushButton, "treeCsvBrowseButton_"+str(i)),
-            ]
-            self.toToggle[p] = {self.tree_type[i]: toggle_lst}
-
-            # show/hide page
-            self.spinboxesToShowPage[p] = [(self.treeNum, i+1)]
-            
-    def _setup_treeThin_pages(self):
-       
-        pages = [
-                self.findChild(QtWidgets.QWidget, "treeThinPage_"+str(i))
-                for i in range(self.treeNum.maximum())
-        ]
-        self.thin_neverbut, self.thin_intervalbut = [], []
-        self.thin_custombut, self.thin_customline = [], []
-        self.thin_freq, self.thin_amount = [], []
-        self.thin_stemsleft, self.thin_branchesleft = [],[]
+        # complete and combobox
+        spec.toComplete = [
+                (self.crop_type[i],type(self.crop_type[i]))]
+        spec.comboBoxes = {self.crop_type[i]: [0,1,2,19,20,29,30,31]}
 
-        for i, p in enumerate(pages):
-            
-            self.help_text[p] = _((
-                    "For each tree species planted, specify if and when "
-                    "thinning or harvest is planned. If trees will be "
-                    "thinned or harvested, specify the percentage of trees "
-                    "that will be felled during each thinning or harvest "
-                    "event, and the percentage of stem and branch biomass "
-                    "that will be left in the field."
-            ))
-
-            self.thin_custombut.append(
-                    p.findChild(QtWidgets.QRadioButton, "thinCustom_"+str(i))
-            )
-            self.thin_intervalbut.append(
-                    p.findChild(QtWidgets.QRadioButton, "thinInterval_"+str(i))
-            )
-            self.thin_neverbut.append(
-                    p.findChild(QtWidgets.QRadioButton, "thinNever_"+str(i))
-            )
-            self.thin_customline.append(
-                    p.findChild(QtWidgets.QLineEdit, "thinCustomLine_"+str(i))
-            )
-            self.thin_freq.append(
-                    p.findChild(QtWidgets.QSpinBox, "thinFreq_"+str(i))
-            )
-            self.thin_amount.append(
-                    p.findChild(QtWidgets.QSpinBox, "treesThinned_"+str(i))
-            )
-            self.thin_stemsleft.append(
-                    p.findChild(QtWidgets.QSpinBox, "thinnedStemsLeft_"+str(i))
-            )
-            self.thin_branchesleft.append(
-                    p.findChild(QtWidgets.QSpinBox,"thinnedBranchesLeft_"+str(i)),
-            )
-            
-            self.toCompleteConditional[p] = [
-                    (self.thin_customline[i], 
-                     type(self.thin_customline[i]), 
-                     self.thin_custombut[i])
-            ]
-
-            # show/hide page
-            self.spinboxesToShowPage[p] = [(self.treeNum, i+1)]
-
-            # button groups
-            never_but = p.findChild(QtWidgets.QRadioButton,
-                                "thinNever_"+str(i))
-            interval_but = p.findChild(QtWidgets.QRadioButton,
-                                   "thinInterval_"+str(i))
-            self.buttonGroups[p] = [
-                    [self.thin_neverbut[i], self.thin_intervalbut[i], 
-                     self.thin_custombut[i]]
-            ]
+        # toggle
+        toggle_lst = self._resolve(names, CROP_TOGGLE_NAMES, i)
+        spec.toToggle = {self.crop_type[i]: toggle_lst}
         
-            # toggle
-            toggle_lst = [
-                    self.thin_amount[i],
-                    p.findChild(QtWidgets.QLabel, "treesThinnedText_"+str(i)),
-                    p.findChild(QtWidgets.QLabel, "treesThinnedLabel_"+str(i)),
-                    p.findChild(QtWidgets.QLabel, "thinnedLeftText_"+str(i)),
-                    self.thin_stemsleft[i],
-                    p.findChild(QtWidgets.QLabel, "thinnedStemsLeftText_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QLabel, "thinnedStemsLeftLabel_"+str(i)),
-                    self.thin_branchesleft[i],
-                    p.findChild(
-                            QtWidgets.QLabel, "thinnedBranchesLeftText_"+str(i)),
-                    p.findChild(
-                            QtWidgets.QLabel,"thinnedBranchesLeftLabel_"+str(i)),
-            ]
-            toggle_lst_custom = [
-                    self.thin_customline[i],
-                    p.findChild(QtWidgets.QLabel,
-                                "thinCustomText_"+str(i)),
-            ]
-            
-            self.toToggle[p] = {
-                    self.thin_intervalbut[i]: toggle_lst,
-                    self.thin_custombut[i]: toggle_lst + toggle_lst_custom
-            }
-            
-            # Validator for the line edits which need a list/range of years
-            reg_exp = "^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$"
-            val = QtGui.QRegExpValidator(QtCore.QRegExp(reg_exp), self)
-            self.thin_customline[i].setValidator(val)
+        # show/hide page
+        spec.spinboxesToShowPage = ((self.cropNum, i+1),)
+        
+        # button groups
+        spec.buttonGroups = ((self.crop_burnyes[i], self.crop_burnno[i]),)
 
-    def _setup_treeMort_pages(self):
+    def _setup_treeMgmt_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = TREE_MGMT_HELP
+
+        # list of widgets
+        self.tree_name.append(
+                names["speciesName_%d" % i]
+        )
+        self.tree_type.append(
+                names["treeType_%d" % i]
+        )
+        self.tree_standdens.append(
+                names["standDens_%d" % i]
+        )
+        self.tree_yearplanted.append(
+                names["yearPlanted_%d" % i]
+        )
         
-        pages = [
-                self.findChild(QtWidgets.QWidget, "treeMortPage_"+str(i))
-                for i in range(self.treeNum.maximum())
+        spec.toComplete = [
+                (self.tree_type[i], type(self.tree_type[i]))
         ]
-        self.mort_amount = []
-        self.mort_stemsleft, self.mort_branchesleft = [], []
+        spec.comboBoxes = {self.tree_type[i]: [0,1,2,4,5,6]}
+
+        # toggle
+        toggle_lst = self._resolve(names, TREE_TOGGLE_NAMES, i)
+        spec.toToggle = {self.tree_type[i]: toggle_lst}
+
+        # show/hide page
+        spec.spinboxesToShowPage = ((self.treeNum, i+1),)
         
-        for i,p in enumerate(pages):
-            
-            self.help_text[p] = _((
-                    "For each tree species planted, specify the expected "
-                    "mortality rate (excluding felled trees), and the "
-                    "percentage of dead stem and branch biomass removed "
-                    "from the field."
-            ))
-
-            self.mort_amount.append(
-                    p.findChild(QtWidgets.QSpinBox, "treesDead_"+str(i))
-            )
-            self.mort_stemsleft.append(
-                    p.findChild(QtWidgets.QSpinBox, "deadStemsLeft_"+str(i))
-            )
-            self.mort_branchesleft.append(
-                    p.findChild(QtWidgets.QSpinBox, "deadBranchesLeft_"+str(i))
-            )
-
-            # show/hide page
-            self.spinboxesToShowPage[p] = [(self.treeNum, i+1)]
+    def _setup_treeThin_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = TREE_THIN_HELP
+
+        tw = ThinWidgets(
+                never=names["thinNever_%d" % i],
+                interval=names["thinInterval_%d" % i],
+                custom=names["thinCustom_%d" % i],
+                line=names["thinCustomLine_%d" % i],
+                freq=names["thinFreq_%d" % i],
+                amount=names["treesThinned_%d" % i],
+                stems_left=names["thinnedStemsLeft_%d" % i],
+                branches_left=names["thinnedBranchesLeft_%d" % i],
+        )
+        self.thin_pages.append(tw)
         
-            # toggle
-            toggle_lst = [
-                    p.findChild(QtWidgets.QLabel,
-                                "deadLeftText_"+str(i)),
-                    self.mort_stemsleft[i],
-                    p.findChild(QtWidgets.QLabel,
-                                "deadStemsLeftText_"+str(i)),
-                    p.findChild(QtWidgets.QLabel,
-                                "deadStemsLeftLabel_"+str(i)),
-                    self.mort_branchesleft[i],
-                    p.findChild(QtWidgets.QLabel,
-                                "deadBranchesLeftText_"+str(i)),
-                    p.findChild(QtWidgets.QLabel,
-                                "deadBranchesLeftLabel_"+str(i)),
-            ]
-            self.toToggle[p] = {self.mort_amount[i]: toggle_lst}
-
-    def _setup_treeGrowth_pages(self):
-       
-        pages = [
-                self.findChild(QtWidgets.QWidget, "treeGrowthPage_"+str(i))
-                for i in range(self.treeNum.maximum())
+        spec.toCompleteConditional = ((tw.line, type(tw.line), tw.custom),)
+
+        # show/hide page
+        spec.spinboxesToShowPage = ((self.treeNum, i+1),)
+
+        # button groups
+        spec.buttonGroups = ((tw.never, tw.interval, tw.custom),)
+    
+        # toggle
+        toggle_lst = [tw.amount, tw.stems_left, tw.branches_left]
+        toggle_lst += self._resolve(names, THIN_TOGGLE_NAMES, i)
+        toggle_lst_custom = [
+                tw.line,
+                names["thinCustomText_%d" % i],
         ]
-        self.growth_csvbut, self.growth_custombut = [], []
-        self.growth_csvline, self.growth_allom = [], []
         
-        for i,p in enumerate(pages):
-            
-            self.help_text[p] = _((
-                    "For each tree species planted, load a growth data "
-                    "file and choose an appropriate allometric model for "
-                    "estimating total tree biomass. Choose the most "
-                    "appropriate model for the project area from the list "
-                    "of models provided."
-                    "\n\nThe growth file must be in .csv format and match "
-                    "the format of the sample growth file (found in "
-                    "shamba/sample_input_files/growth.csv)."
-            ))
-
-            self.growth_allom.append(
-                    p.findChild(QtWidgets.QComboBox, "allom_"+str(i))
-            )
-            self.growth_csvbut.append(
-                    p.findChild(QtWidgets.QRadioButton,"growthCsvButton_"+str(i))
-            )
-            self.growth_custombut.append(
-                    p.findChild(QtWidgets.QRadioButton,
-                                "growthCustomButton_"+str(i))
-            )
-            self.growth_csvline.append(
-                    p.findChild(QtWidgets.QLineEdit, 
-                                "growthCsvBrowseBox_"+str(i))
-            )
-
-            # start page stuff
-            self.toComplete[p] = [
-                    (self.growth_allom[i], type(self.growth_allom[i]))
-            ]
-                    
-            self.comBox[p] = {self.growth_allom[i]: [0,1,2,7,8,12,13,14]} 
-            self.spinboxesToShowPage[p] = [(self.treeNum, i+1)]
-            self.buttonGroups[p] = [
-                    [self.growth_csvbut[i], self.growth_custombut[i]]
-            ]
+        spec.toToggle = {
+                tw.interval: toggle_lst,
+                tw.custom: toggle_lst + toggle_lst_custom
+        }
         
-            # complete conditional
-            self.toCompleteConditional[p] = [
-                    (self.growth_csvline[i], 
-                     type(self.growth_csvline[i]), 
-                     self.growth_csvbut[i])
-            ]
-
-            # toggle
-            toggle_lst = [
-                    self.growth_csvline[i],
-                    p.findChild(QtWidgets.QPushButton,
-                                "growthCsvBrowseButton_"+str(i)),
-                    p.findChild(QtWidgets.QLabel,
-                                "growthCsvLabel_"+str(i))
-            
-            ]
-            self.toToggle[p] = {self.growth_csvbut[i]: toggle_lst}
-            
-        # file browser stuff needs to be done explicitly since 
-        # the slot is called at runtime (when csv_browse_but == button 4)
-        self.growthCsvBrowseButton_0.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_0)
-        )
-        self.growthCsvBrowseButton_1.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_1)
+        # Validator for the line edit which needs a list/range of years
+        tw.line.setValidator(self._years_validator)
+
+    def _setup_treeMort_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = TREE_MORT_HELP
+
+        self.mort_amount.append(
+                names["treesDead_%d" % i]
         )
-        self.growthCsvBrowseButton_2.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_2)
+        self.mort_stemsleft.append(
+                names["deadStemsLeft_%d" % i]
         )
-        self.growthCsvBrowseButton_3.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_3)
+        self.mort_branchesleft.append(
+                names["deadBranchesLeft_%d" % i]
         )
-        self.growthCsvBrowseButton_4.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_4)
+
+        # show/hide page
+        spec.spinboxesToShowPage = ((self.treeNum, i+1),)
+    
+        # toggle
+        toggle_lst = [self.mort_stemsleft[i], self.mort_branchesleft[i]]
+        toggle_lst += self._resolve(names, MORT_TOGGLE_NAMES, i)
+        spec.toToggle = {self.mort_amount[i]: toggle_lst}
+
+    def _setup_treeGrowth_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = TREE_GROWTH_HELP
+
+        self.growth_allom.append(
+                names["allom_%d" % i]
         )
-        self.growthCsvBrowseButton_5.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_5)
+        self.growth_csvbut.append(
+                names["growthCsvButton_%d" % i]
         )
-        self.growthCsvBrowseButton_6.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_6)
+        self.growth_custombut.append(
+                names["growthCustomButton_%d" % i]
         )
-        self.growthCsvBrowseButton_7.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_7)
+        self.growth_csvline.append(
+                names["growthCsvBrowseBox_%d" % i]
         )
-        self.growthCsvBrowseButton_8.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_8)
+
+        # start page stuff
+        spec.toComplete = [
+                (self.growth_allom[i], type(self.growth_allom[i]))
+        ]
+                
+        spec.comboBoxes = {self.growth_allom[i]: [0,1,2,7,8,12,13,14]} 
+        spec.spinboxesToShowPage = ((self.treeNum, i+1),)
+        spec.buttonGroups = (
+                (self.growth_csvbut[i], self.growth_custombut[i]),
         )
-        self.growthCsvBrowseButton_9.clicked.connect(
-                lambda: self.browse_for_file(self.growthCsvBrowseBox_9)
+    
+        # complete conditional
+        spec.toCompleteConditional = (
+                (self.growth_csvline[i], 
+                 type(self.growth_csvline[i]), 
+                 self.growth_csvbut[i]),
         )
-    def _setup_litter_pages(self):
 
-        pages = [
-                self.findChild(QtWidgets.QWidget, "litterPage_"+str(i)) 
-                for i in range(self.litterNum.maximum())
+        # toggle
+        toggle_lst = [
+                self.growth_csvline[i],
+                names["growthCsvBrowseButton_%d" % i],
+                names["growthCsvLabel_%d" % i]
+        
         ]
-        self.litter_input = []
-        self.litter_freq = []
-        self.litter_customline = []
-        self.litter_intervalbut = []
-        self.litter_custombut = []
+        spec.toToggle = {self.growth_csvbut[i]: toggle_lst}
 
-        for i,p in enumerate(pages):
-            self.help_text[p] = _((
-                    "If organic inputs such as litter, mulch or manure that "
-                    "originate outside the field are added to the field, "
-                    "specify how often these inputs are added, and the "
-                    "approximate dry weight of each application."
-                    "\n\nIf no organic inputs are added, go back to the "
-                    "first screen and set the number of kinds of external "
-                    "organic inputs added to zero."
-            ))
-
-            # populate lists of widgets
-            self.litter_input.append(
-                    p.findChild(QtWidgets.QDoubleSpinBox,
-                                "litterInput_"+str(i))
-            )
-            self.litter_freq.append(
-                    p.findChild(QtWidgets.QSpinBox,
-                                "litterFreq_"+str(i))
-            )
-            self.litter_customline.append(
-                    p.findChild(QtWidgets.QLineEdit,
-                                "litterCustomLine_"+str(i))
-            )
-            self.litter_intervalbut.append(
-                    p.findChild(QtWidgets.QRadioButton,
-                                "litterInterval_"+str(i))
-            )
-            self.litter_custombut.append(
-                    p.findChild(QtWidgets.QRadioButton,
-                                "litterCustom_"+str(i))
-            )
-
-            # complete (conditional)
-            self.toCompleteConditional[p] = [
-                    (self.litter_customline[i], 
-                     type(self.litter_customline[i]), 
-                     self.litter_custombut[i])
-            ]
-            
-            self.spinboxesToShowPage[p] = [(self.litterNum, i+1)]
-            self.buttonGroups[p] = [
-                    [self.litter_custombut[i], self.litter_intervalbut[i]]]
-                
-            # to toggle
-            toggle_lst = [
-                    self.litter_customline[i],
-                    p.findChild(QtWidgets.QLabel, 
-                                "litterCustomText_"+str(i)),
-            ]
-            self.toToggle[p] = {self.litter_custombut[i]: toggle_lst}
+        # file browser
+        names["growthCsvBrowseButton_%d" % i].clicked.connect(
+                partial(self.browse_for_file, self.growth_csvline[i])
+        )
+
+    def _setup_litter_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = LITTER_HELP
+
+        # populate lists of widgets
+        self.litter_input.append(
+                names["litterInput_%d" % i]
+        )
+        self.litter_freq.append(
+                names["litterFreq_%d" % i]
+        )
+        self.litter_customline.append(
+                names["litterCustomLine_%d" % i]
+        )
+        self.litter_intervalbut.append(
+                names["litterInterval_%d" % i]
+        )
+        self.litter_custombut.append(
+                names["litterCustom_%d" % i]
+        )
+
+        # complete (conditional)
+        spec.toCompleteConditional = (
+                (self.litter_customline[i], 
+                 type(self.litter_customline[i]), 
+                 self.litter_custombut[i]),
+        )
+        
+        spec.spinboxesToShowPage = ((self.litterNum, i+1),)
+        spec.buttonGroups = (
+                (self.litter_custombut[i], self.litter_intervalbut[i]),
+        )
             
-            # Validator for the line edits which need a list/range of years
-            reg_exp = "^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$"
-            val = QtGui.QRegExpValidator(QtCore.QRegExp(reg_exp), self)
-            self.litter_customline[i].setValidator(val)
+        # to toggle
+        toggle_lst = [
+                self.litter_customline[i],
+                names["litterCustomText_%d" % i],
+        ]
+        spec.toToggle = {self.litter_custombut[i]: toggle_lst}
+        
+        # Validator for the line edit which needs a list/range of years
+        self.litter_customline[i].setValidator(self._years_validator)
+
+    def _setup_fert_page(self, i, p):
+        names = self._name_map(p)
+        spec = self.pageSpecs[p]
+
+        self.help_text[p] = FERT_HELP
+        # populate the widget lists
+        self.fert_input.append(
+                names["fertInput_%d" % i]
+        )
+        self.fert_nitrogen.append(
+                names["fertNitrogen_%d" % i]
+        )
+        self.fert_freq.append(
+                names["fertFreq_%d" % i]
+        )
+        self.fert_customline.append(
+                names["fertCustomLine_%d" % i]
+        )
+        self.fert_custombut.append(
+                names["fertCustom_%d" % i]
+        )
+        self.fert_intervalbut.append(
+                names["fertInterval_%d" % i]
+        )
+        
+        # to complete
+        spec.toCompleteConditional = (
+                (self.fert_customline[i], 
+                 type(self.fert_customline[i]), 
+                 self.fert_custombut[i]),
+        )
+         
+        # show/hide page
+        spec.spinboxesToShowPage = ((self.fertNum, i+1),)
 
-    def _setup_fert_pages(self):
+        # button groups
+        spec.buttonGroups = (
+                (self.fert_intervalbut[i], self.fert_custombut[i]),
+        )
         
-        pages = [
-                self.findChild(QtWidgets.QWidget, "fertPage_"+str(i))
-                for i in range(self.fertNum.maximum())
+        # to toggle
+        toggle_lst = [
+                self.fert_customline[i],
+                names["fertCustomText_%d" % i],
         ]
-        self.fert_input = []
-        self.fert_nitrogen = []
-        self.fert_freq = []
-        self.fert_customline = []
-        self.fert_intervalbut = []
-        self.fert_custombut = []
+        spec.toToggle = {self.fert_custombut[i]: toggle_lst}
 
-        for i,p in enumerate(pages):
-            self.help_text[p] = _((
-                    "If synthetic fertilisers are added to the field, "
-                    "specify how often these are added, the approximate "
-                    "amount added for each application, and the nitrogen "
-                    "content of the fertiliser."
-                    "\n\nIf the fertiliser used has an NPK rating on the "
-                    "packaging (e.g. 16-4-8), the first number in the "
-                    "sequence is the percentage nitrogen (e.g. 16% in this "
-                    "example)."
-                    "\n\nIf no synthetic fertilisers are added, go back to "
-                    "the first screen and set the number of kinds of "
-                    "synthetic fertiliser added to zero."
-            ))
-            # populate the widget lists
-            self.fert_input.append(
-                    p.findChild(QtWidgets.QDoubleSpinBox,
-                                "fertInput_"+str(i))
-            )
-            self.fert_nitrogen.append(
-                    p.findChild(QtWidgets.QSpinBox,
-                                "fertNitrogen_"+str(i))
-            )
-            self.fert_freq.append(
-                    p.findChild(QtWidgets.QSpinBox,
-                                "fertFreq_"+str(i))
-            )
-            self.fert_customline.append(
-                    p.findChild(QtWidgets.QLineEdit, 
-                                "fertCustomLine_"+str(i))
-            )
-            self.fert_custombut.append(
-                    p.findChild(QtWidgets.QRadioButton,
-                                "fertCustom_"+str(i))
-            )
-            self.fert_intervalbut.append(
-                    p.findChild(QtWidgets.QRadioButton,
-                                "fertInterval_"+str(i))
-            )
-            
-            # to complete
-            self.toCompleteConditional[p] = [
-                    (self.fert_customline[i], 
-                     type(self.fert_customline[i]), 
-                     self.fert_custombut[i])
-            ]
-             
-            # show/hide page
-            self.spinboxesToShowPage[p] = [(self.fertNum, i+1)]
-
-            # button groups
-            self.buttonGroups[p] = [
-                    [self.fert_intervalbut[i], self.fert_custombut[i]]]
-            
-            # to toggle
-            toggle_lst = [
-                    self.fert_customline[i],
-                    p.findChild(QtWidgets.QLabel,
-                                "fertCustomText_"+str(i)),
-            ]
-            self.toToggle[p] = {self.fert_custombut[i]: toggle_lst}
-
-            # Validator for the line edits which need a list/range of years
-            reg_exp = "^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$"
-            val = QtGui.QRegExpValidator(QtCore.QRegExp(reg_exp), self)
-            self.fert_customline[i].setValidator(val)    
+        # Validator for the line edit which needs a list/range of years
+        self.fert_customline[i].setValidator(self._years_validator)
 
 
 if __name__ == '__main__':
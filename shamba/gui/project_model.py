@@ -3,12 +3,10 @@
 """Run the baseline/intervention model from the gui."""
 
 import os
-import sys
-try:
-    from StringIO import StringIO ## for Python 2
-except ImportError:
-    from io import StringIO ## for Python 3
+from contextlib import redirect_stdout
+from io import StringIO
 import logging as log
+import re
 import shutil
 import numpy as np
 
@@ -24,6 +22,9 @@ from shamba.model.tree_model import TreeModel
 from shamba.model.litter import LitterModel
 from shamba.model import emit
 
+# a number or range of numbers (e.g. "3" or "3-6") in a parse_regex string
+_RANGE_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
 
 class ProjectModel(object):
     
@@ -51,261 +52,205 @@ class ProjectModel(object):
 
         self.soil = Soil(self.ui, gen_params)
 
-        self.crops = []
-        for i in range(self.ui.cropNum.value()):
-            self.crops.append(Crop(self.ui, i))
-        
-        self.trees = []
-        for i in range(self.ui.treeNum.value()):
-            self.trees.append(Tree(self.ui, i))
-        
-        self.litter = []
-        for i in range(self.ui.litterNum.value()):
-            self.litter.append(Litter(self.ui, i))
-        
-        self.fert = []
-        for i in range(self.ui.fertNum.value()):
-            self.fert.append(Fertiliser(self.ui, i))
+        # one object per species/input - each spinbox value is read once
+        ui = self.ui
+        self.crops = [Crop(ui, i) for i in range(ui.cropNum.value())]
+        self.trees = [Tree(ui, i) for i in range(ui.treeNum.value())]
+        self.litter = [Litter(ui, i) for i in range(ui.litterNum.value())]
+        self.fert = [Fertiliser(ui, i) for i in range(ui.fertNum.value())]
+
+        # description is made when first needed - see description property
+        self._description = None
 
-        self.save_description()
+    @property
+    def description(self):
+        """Description of the baseline/intervention (as shown in the gui)"""
+        if self._description is None:
+            self._description = self._build_description()
+        return self._description
 
     def save_data(self):
         """Save info for this baseline/intervention.
         Called in the shamba.pyw file as a slot."""        
         # make directory 
         if self.isBaseline:
-            proj_dir = os.path.join(
-                    cfg.OUT_DIR, 'baselines', self.name)
+            proj_dir = os.path.join(cfg.OUT_DIR, 'baselines', self.name)
+            info_basename = 'baseline_info.txt'
         else:
-            proj_dir = os.path.join(
-                    cfg.OUT_DIR, 'interventions', self.name)
+            proj_dir = os.path.join(cfg.OUT_DIR, 'interventions', self.name)
+            info_basename = 'intervention_info.txt'
         if not os.path.exists(proj_dir):
             os.makedirs(proj_dir)
 
         # general description (what's printed out in the box of the gui)
-        if self.isBaseline:
-            filename = os.path.join(cfg.OUT_DIR, 'baselines',
-                                    self.name, 'baseline_info.txt'
-            )
-        else:
-            filename = os.path.join(cfg.OUT_DIR, 'interventions',
-                                    self.name, 'intervention_info.txt'
-            )
-        with open(filename, 'w+') as fout:
+        with open(os.path.join(proj_dir, info_basename), 'w+') as fout:
             fout.write(self.description)
         
         # save soil info
         self.soil.soil_params.save_(
                 os.path.join(proj_dir, 'soil_params.csv'))
         try:  # see if soil input file exists
-            dest_file = \
-                    os.path.basename(self.soil.soilFilename).split(".csv")[0]
-            dest_file += "_" + self.name + ".csv"
-            dest_file = os.path.join(cfg.INP_DIR, dest_file)
-            shutil.copyfile(self.soil.soilFilename, dest_file)
+            src_file = self.soil.soilFilename
+            shutil.copyfile(
+                    src_file, _input_copy_path(src_file, "_" + self.name))
         except AttributeError:  # no soil input file
             pass
 
         # crop info
         for i, crop in enumerate(self.crops):
-            if len(self.crops) == 1:
-                params_basename = "crop_params.csv"
-                model_basename = "crop_model.csv"
-            else:
-                params_basename = "crop_params_" + str(i+1) + ".csv"
-                model_basename = "crop_model_" + str(i+1) + ".csv"
+            suffix = _file_suffix(i, len(self.crops))
             crop.params.save_(
-                    os.path.join(proj_dir, params_basename))
+                    os.path.join(proj_dir, "crop_params%s.csv" % suffix))
             crop.model.save_(
-                    os.path.join(proj_dir, model_basename))
+                    os.path.join(proj_dir, "crop_model%s.csv" % suffix))
         
         # tree info
         for i, tree in enumerate(self.trees):
-            if len(self.trees) == 1:
-                params_basename = "tree_params.csv"
-                growth_basename = "tree_growth.csv"
-                model_basename = "tree_model.csv"
-            else:
-                params_basename = "tree_params_" + str(i+1) + ".csv"
-                growth_basename = "tree_growth_" + str(i+1) + ".csv"
-                model_basename = "tree_model_" + str(i+1) + ".csv"
+            suffix = _file_suffix(i, len(self.trees))
             tree.params.save_(
-                    os.path.join(proj_dir, params_basename))
+                    os.path.join(proj_dir, "tree_params%s.csv" % suffix))
             tree.growth.save_(
-                    os.path.join(proj_dir, growth_basename))
+                    os.path.join(proj_dir, "tree_growth%s.csv" % suffix))
             tree.model.save_(
-                    os.path.join(proj_dir, model_basename))
+                    os.path.join(proj_dir, "tree_model%s.csv" % suffix))
             
             try: # growth file
-                dest_file = \
-                        os.path.basename(tree.growthFilename).split(".csv")[0]
-                if len(self.trees) == 1:
-                    dest_file += "_" + self.name + ".csv"    
-                else:
-                    dest_file += "_" + self.name + "_" + str(i+1) + ".csv"
-                dest_file = os.path.join(cfg.INP_DIR, dest_file)
-                shutil.copyfile(tree.growthFilename, dest_file)
+                src_file = tree.growthFilename
+                shutil.copyfile(
+                        src_file, 
+                        _input_copy_path(src_file, "_" + self.name + suffix))
             except AttributeError: # no growth file
                 print ("attribute errr")
 
-        # litter and fert info
+        # litter and fert info (no underscore before the number)
         for i, litt in enumerate(self.litter):
-            if len(self.litter) == 1:
-                model_basename = "litter_model.csv"
-            else:
-                model_basename = "litter_model" + str(i+1) + ".csv"
+            suffix = _file_suffix(i, len(self.litter), sep="")
             litt.model.save_(
-                    os.path.join(proj_dir, model_basename))
+                    os.path.join(proj_dir, "litter_model%s.csv" % suffix))
         
         for i, fert in enumerate(self.fert):
-            if len(self.fert) == 1:
-                model_basename = "fert_model.csv"
-            else:
-                model_basename = "fert_model" + str(i+1) + ".csv"
+            suffix = _file_suffix(i, len(self.fert), sep="")
             fert.model.save_(
-                    os.path.join(proj_dir, model_basename))
+                    os.path.join(proj_dir, "fert_model%s.csv" % suffix))
 
-    def save_description(self):
-        """Print the baseline/intervention data to the description str"""
-        
-        # redirect stdout to StringIO object
-        old_stdout = sys.stdout
-        sys.stdout = mystdout = StringIO() 
+    def _build_description(self):
+        """Return the baseline/intervention data as a description str"""
+        ui = self.ui
+        # lines of the description
+        parts = []
+        w = parts.append
 
         if self.isBaseline:
-            print ("NEW BASELINE")
-            print ("Baseline name:\n\t%s" % self.name)
+            w("NEW BASELINE")
+            w("Baseline name:\n\t%s" % self.name)
         else:
-            print ("NEW INTERVENTION")
-            print ("Intervention name:\n\t%s" % self.name)
-
-        print ("\nSOIL PARAMETERS")
-        print ("Soil parameters loaded from:")
-        if self.ui.soilFromHWSD.isChecked():
-            print ("\tHWSD data")
-        elif self.ui.soilFromCsv.isChecked():
-            print ("\t%s" % self.soil.soilFilename)
+            w("NEW INTERVENTION")
+            w("Intervention name:\n\t%s" % self.name)
+
+        w("\nSOIL PARAMETERS")
+        w("Soil parameters loaded from:")
+        if ui.soilFromHWSD.isChecked():
+            w("\tHWSD data")
+        elif ui.soilFromCsv.isChecked():
+            w("\t%s" % self.soil.soilFilename)
         else:
-            print ("\tcustom data")
-        self.soil.soil_params.print_()
-
-        print ("\nSOIL MANAGEMENT")
-        print ("Soil cover (1 covered, 0 bare):\n\t", self.soil.cover )
-        print ("Fire:")
-        if self.ui.fireNever.isChecked():
-            print ("\tNever")
-        elif self.ui.fireInterval.isChecked():
-            print ("\tEvery %d years" % self.ui.fireFreq.value())
+            w("\tcustom data")
+        w(_printed(self.soil.soil_params.print_))
+
+        w("\nSOIL MANAGEMENT")
+        w("Soil cover (1 covered, 0 bare):\n\t %s" % self.soil.cover)
+        w("Fire:")
+        if ui.fireNever.isChecked():
+            w("\tNever")
+        elif ui.fireInterval.isChecked():
+            w("\tEvery %d years" % ui.fireFreq.value())
         else:
-            print ("\tIn years: %s" % str(self.ui.fireCustomLine.text()))
+            w("\tIn years: %s" % str(ui.fireCustomLine.text()))
         
-        print ("\nCROP MANAGEMENT")
-        if self.ui.cropNum.value() == 0:
-            print ("*** No crop management ***")
-        else:
-            for i in range(self.ui.cropNum.value()):
-                print ("\nCROP %d" % (i+1))
-                print ("Crop type:\n\t%s" % (
-                        str(self.ui.crop_type[i].currentText())
-                ))
-                print ("Crop yield:\n\t%.1f t DM / ha" % (
-                        self.ui.crop_yield[i].value()))
-                print ("Residues left in field after harvest:\n\t%d %%" % (
-                        self.ui.crop_leftinfield[i].value()))
-                print ("Off-farm residues burned:\n\t%s" % (
-                        str(self.ui.crop_burnyes[i].isChecked())))
+        w("\nCROP MANAGEMENT")
+        if not self.crops:
+            w("*** No crop management ***")
+        for i in range(len(self.crops)):
+            crop_type, crop_yield = ui.crop_type[i], ui.crop_yield[i]
+            left, burn = ui.crop_leftinfield[i], ui.crop_burnyes[i]
+            w("\nCROP %d" % (i+1))
+            w("Crop type:\n\t%s" % str(crop_type.currentText()))
+            w("Crop yield:\n\t%.1f t DM / ha" % crop_yield.value())
+            w("Residues left in field after harvest:\n\t%d %%" % (
+                    left.value()))
+            w("Off-farm residues burned:\n\t%s" % str(burn.isChecked()))
                 
-        print ("\nTREE MANAGEMENT")
-        if self.ui.treeNum.value() == 0:
-            print ("*** No tree management ***")
-        else:
-            for i in range(self.ui.treeNum.value()):
-                print ("\nTREE %d" % (i+1))
-                print ("Tree species:\n\t%s" % (
-                        str(self.ui.tree_name[i].text())
-                ))
-                print ("Tree type:\n\t%s" % (
-                        str(self.ui.tree_type[i].currentText())
-                ))
-                print ("Tree stocking density:\n\t%d / ha" % (
-                        self.ui.tree_standdens[i].value()))
-                print ("Year planted:\n\tyear %d" % (
-                        self.ui.tree_yearplanted[i].value()))
-                
-                print ("Thinning:")
-                if self.ui.thin_neverbut[i].isChecked():
-                    print ("\tNever")
-                elif self.ui.thin_intervalbut[i].isChecked():
-                    print ("\tEvery %d years" % self.ui.thin_freq[i].value())
-                else:
-                    print ("\tIn years: %s" % (
-                            str(self.ui.thin_customline[i].text())
-                    ))
-                if not self.ui.thin_neverbut[i].isChecked():
-                    print ("Trees thinned when thinning occurs:\n\t%d %%" % (
-                            self.ui.thin_amount[i].value()))
-                    print ("Amount of thinned mass left in field:")
-                    print ("\tStems:\n\t\t%d %%" % (
-                            self.ui.thin_stemsleft[i].value()))
-                    print ("\tBranches:\n\t\t%d %%" % (
-                            self.ui.thin_branchesleft[i].value()))
-                    
-                print ("Mortality rate:\n\t %d %% per year" % (
-                        self.ui.mort_amount[i].value()))
-                if self.ui.mort_amount[i].value() != 0:
-                    print ("Amount of dead mass left in field:")
-                    print ("\tStems:\n\t\t%d %%" % (
-                            self.ui.mort_stemsleft[i].value()))
-                    print ("\tBranches:\n\t\t%d %%" % (
-                            self.ui.mort_branchesleft[i].value()))
+        w("\nTREE MANAGEMENT")
+        if not self.trees:
+            w("*** No tree management ***")
+        for i, tree in enumerate(self.trees):
+            tw = ui.thin_pages[i]
+            mort = ui.mort_amount[i].value()
+            w("\nTREE %d" % (i+1))
+            w("Tree species:\n\t%s" % str(ui.tree_name[i].text()))
+            w("Tree type:\n\t%s" % str(ui.tree_type[i].currentText()))
+            w("Tree stocking density:\n\t%d / ha" % (
+                    ui.tree_standdens[i].value()))
+            w("Year planted:\n\tyear %d" % ui.tree_yearplanted[i].value())
+            
+            w("Thinning:")
+            never = tw.never.isChecked()
+            if never:
+                w("\tNever")
+            elif tw.interval.isChecked():
+                w("\tEvery %d years" % tw.freq.value())
+            else:
+                w("\tIn years: %s" % str(tw.line.text()))
+            if not never:
+                w("Trees thinned when thinning occurs:\n\t%d %%" % (
+                        tw.amount.value()))
+                w("Amount of thinned mass left in field:")
+                w("\tStems:\n\t\t%d %%" % tw.stems_left.value())
+                w("\tBranches:\n\t\t%d %%" % tw.branches_left.value())
                 
-                print ("Tree growth loaded from:")
-                if self.ui.growth_csvbut[i].isChecked():
-                    print ("\t%s" % self.trees[i].growthFilename)
-                else:
-                    print ("\tcustom data")
-                print ("Allometric:\n\t%s" % (
-                        str(self.ui.growth_allom[i].currentText())))
-                self.trees[i].growth.print_()
+            w("Mortality rate:\n\t %d %% per year" % mort)
+            if mort != 0:
+                w("Amount of dead mass left in field:")
+                w("\tStems:\n\t\t%d %%" % ui.mort_stemsleft[i].value())
+                w("\tBranches:\n\t\t%d %%" % (
+                        ui.mort_branchesleft[i].value()))
+            
+            w("Tree growth loaded from:")
+            if ui.growth_csvbut[i].isChecked():
+                w("\t%s" % tree.growthFilename)
+            else:
+                w("\tcustom data")
+            w("Allometric:\n\t%s" % str(ui.growth_allom[i].currentText()))
+            w(_printed(tree.growth.print_))
         
-        print ("\nEXTERNAL ORGANIC INPUTS")
-        if self.ui.litterNum.value() == 0:
-            print ("*** No external organic inputs ***")
-        else:
-            for i in range(self.ui.litterNum.value()):
-                print ("\nEOI %d" % (i+1))
-                print ("Input quantity:\n\t%.1f t DM / ha" % (
-                        self.ui.litter_input[i].value()))
-                print ("Input frequency:")
-                if self.ui.litter_intervalbut[i].isChecked():
-                    print ("\tEvery %d years" % self.ui.litter_freq[i].value())
-                else:
-                    print ("\tIn years: %s" % (
-                            str(self.ui.litter_customline[i].text())
-                    ))
-
-        print ("\nSYNTHETIC FERTILISER")
-        if self.ui.fertNum.value() == 0:
-            print ("*** No fertiliser ***")
-        else:
-            for i in range(self.ui.fertNum.value()):
-                print ("\nFERTILISER %d" % (i+1))
-                print ("Input quantity:\n\t%.1f t DM / ha" % (
-                        self.ui.fert_input[i].value()))
-                print ("Nitrogen content:\n\t%.1f %% N" % (
-                        self.ui.fert_nitrogen[i].value()))
-                print ("Input frequency:")
-                if self.ui.fert_intervalbut[i].isChecked():
-                    print ("\tEvery %d years" % self.ui.fert_freq[i].value())
-                else:
-                    print ("\tIn years: %s" % (
-                            str(self.ui.fert_customline[i].text())
-                    ))
-
-        # save the description from the StringIO object
-        sys.stdout = old_stdout
-        self.description = mystdout.getvalue()
-        mystdout.close()
+        w("\nEXTERNAL ORGANIC INPUTS")
+        if not self.litter:
+            w("*** No external organic inputs ***")
+        for i in range(len(self.litter)):
+            w("\nEOI %d" % (i+1))
+            w("Input quantity:\n\t%.1f t DM / ha" % (
+                    ui.litter_input[i].value()))
+            w("Input frequency:")
+            if ui.litter_intervalbut[i].isChecked():
+                w("\tEvery %d years" % ui.litter_freq[i].value())
+            else:
+                w("\tIn years: %s" % str(ui.litter_customline[i].text()))
+
+        w("\nSYNTHETIC FERTILISER")
+        if not self.fert:
+            w("*** No fertiliser ***")
+        for i in range(len(self.fert)):
+            w("\nFERTILISER %d" % (i+1))
+            w("Input quantity:\n\t%.1f t DM / ha" % ui.fert_input[i].value())
+            w("Nitrogen content:\n\t%.1f %% N" % (
+                    ui.fert_nitrogen[i].value()))
+            w("Input frequency:")
+            if ui.fert_intervalbut[i].isChecked():
+                w("\tEvery %d years" % ui.fert_freq[i].value())
+            else:
+                w("\tIn years: %s" % str(ui.fert_customline[i].text()))
+
+        return "\n".join(parts) + "\n"
 
 class Soil(object):
     """Object for the soil and fire params."""
@@ -352,18 +297,20 @@ class Soil(object):
     def get_soil_mgmt_params(self):
         """Read soil cover and fire info."""
         cover = self._get_cover_from_ui()
+        n_years = cfg.N_YEARS
     
-        fire = np.zeros(cfg.N_YEARS)   # N_YEARS now defined
+        fire = np.zeros(n_years)
         if self.ui.fireNever.isChecked():
             pass     # already 0
         elif self.ui.fireInterval.isChecked():
-            years = range(0, cfg.N_YEARS, self.ui.fireFreq.value())
-            years = years[1:]
-            fire[years] = 1  # shift
+            # every freq years, starting at year freq
+            freq = self.ui.fireFreq.value()
+            if freq > 0:
+                fire[np.arange(freq, n_years, freq)] = 1
         elif self.ui.fireCustom.isChecked():
             years = parse_regex(str(self.ui.fireCustomLine.text()))
-            years = years[years>0]  # cut off any <=0 in the input
-            years = years[years<=cfg.N_YEARS]  # cut off > cfg.N_YEARS
+            # cut off any <=0 or > N_YEARS in the input
+            years = years[(years>0) & (years<=n_years)]
             fire[years-1] = 1
 
         return cover, fire
@@ -376,13 +323,9 @@ class Soil(object):
                 self.ui.julCover, self.ui.augCover, self.ui.sepCover,
                 self.ui.octCover, self.ui.novCover, self.ui.decCover
         ]
-        cover = np.zeros(len(months))
-        for i in range(len(months)):
-            if months[i].isChecked(): 
-                cover[i] = 1
-            # else it stays 0
-
-        return cover
+        # 1 if covered, 0 if bare
+        return np.fromiter(
+                (m.isChecked() for m in months), dtype=float, count=12)
 
 
 class Crop(object):
@@ -474,54 +417,55 @@ class Tree(object):
 
     def get_tree_thinning(self):
         """Read tree thinning info from project dialog for this tree_num"""
-        if self.ui.thin_neverbut[self.tree_num].isChecked():
+        n_years = cfg.N_YEARS
+        tw = self.ui.thin_pages[self.tree_num]
+        if tw.never.isChecked():
             # Use default values (namely, no thinning)
             thin = None
             thin_frac = None
         else:
-            thin = np.zeros(cfg.N_YEARS+1)
-            thin_amt = self.ui.thin_amount[self.tree_num].value() * 0.01
-            thin_frac = np.array([
-                    1,
-                    self.ui.thin_branchesleft[self.tree_num].value() * 0.01,
-                    self.ui.thin_stemsleft[self.tree_num].value() * 0.01,
-                    1,  # root always 1
-                    1
-            ])
+            thin = np.zeros(n_years+1)
+            thin_amt = tw.amount.value() * 0.01
+            # percentages left in field -> fractions (root always 1)
+            thin_frac = 0.01 * np.array([
+                    100,
+                    tw.branches_left.value(),
+                    tw.stems_left.value(),
+                    100,
+                    100
+            ], dtype=float)
                       
-            if self.ui.thin_intervalbut[self.tree_num].isChecked():
+            if tw.interval.isChecked():
+                # every freq years after the year of planting
                 yp = self.ui.tree_yearplanted[self.tree_num].value()
-                freq = self.ui.thin_freq[self.tree_num].value()
-                years = range(yp-1, cfg.N_YEARS+1, freq)
-                years = years[1:]
-                thin[years] = thin_amt
-            elif self.ui.thin_custombut[self.tree_num].isChecked():
-                years = parse_regex(
-                        str(self.ui.thin_customline[self.tree_num].text())
-                )
-                years = years[years>0] # cut off <=0
-                years = years[years<=cfg.N_YEARS+1] # cut off > cfg.N_YEAR+1
+                freq = tw.freq.value()
+                if freq > 0:
+                    thin[np.arange(yp-1+freq, n_years+1, freq)] = thin_amt
+            elif tw.custom.isChecked():
+                years = parse_regex(str(tw.line.text()))
+                # cut off <=0 and > N_YEARS+1
+                years = years[(years>0) & (years<=n_years+1)]
                 thin[years-1] = thin_amt
         
         return thin, thin_frac
         
     def get_tree_mortality(self):
         """Read tree death info from project dialog for this tree_num.""" 
-        if self.ui.mort_amount[self.tree_num].value() == 0:
+        mort_pct = self.ui.mort_amount[self.tree_num].value()
+        if mort_pct == 0:
             mort = None
             mort_frac = None
         else:
-
-            mort_amt = self.ui.mort_amount[self.tree_num].value() * 0.01
-            mort = np.array((cfg.N_YEARS+1) * [mort_amt])
+            mort = np.full(cfg.N_YEARS+1, mort_pct * 0.01)
             
-            mort_frac = np.array([
-                    1,
-                    self.ui.mort_branchesleft[self.tree_num].value() * 0.01,
-                    self.ui.mort_stemsleft[self.tree_num].value() * 0.01,
-                    1,  # roots always 1
-                    1
-            ])
+            # percentages left in field -> fractions (roots always 1)
+            mort_frac = 0.01 * np.array([
+                    100,
+                    self.ui.mort_branchesleft[self.tree_num].value(),
+                    self.ui.mort_stemsleft[self.tree_num].value(),
+                    100,
+                    100
+            ], dtype=float)
 
         return mort, mort_frac
 
@@ -570,20 +514,18 @@ class Litter(object):
 
     def get_litter(self):
         """Read litter info from ui."""
+        n_years = cfg.N_YEARS
+        # qty in kg - convert to tonnes here
+        qty = 0.001 * self.ui.litter_input[self.litter_num].value()
         if self.ui.litter_intervalbut[self.litter_num].isChecked():
-            # qty in kg - convert to tonnes here
-            qty = 0.001 * self.ui.litter_input[self.litter_num].value()
             freq = self.ui.litter_freq[self.litter_num].value()
             model = LitterModel.from_defaults(freq, qty)
         elif self.ui.litter_custombut[self.litter_num].isChecked():
-            # convert qty to tonnes
-            qty = 0.001 * self.ui.litter_input[self.litter_num].value()
             years = parse_regex(
                     str(self.ui.litter_customline[self.litter_num].text())
             )
-            years = years[years>0] # cut off <=0
-            years = years[years<=cfg.N_YEARS] # cut off > N_YEARS
-            litter = np.zeros(cfg.N_YEARS)
+            years = years[(years>0) & (years<=n_years)] # cut off <=0, >N_YEARS
+            litter = np.zeros(n_years)
             litter[years-1] = qty   # convert to 0-indexing
             model = LitterModel.from_defaults(0,0,litterVector=litter)
             
@@ -605,28 +547,50 @@ class Fertiliser(object):
 
     def get_fert(self):
         """Read fert info from gui.""" 
+        n_years = cfg.N_YEARS
+        # convert mass to tonnes, and nitrogen % to a fraction
+        mass = 0.001 * self.ui.fert_input[self.fert_num].value()
+        nitrogen = self.ui.fert_nitrogen[self.fert_num].value() * 0.01
         if self.ui.fert_intervalbut[self.fert_num].isChecked():
-            # convert mass to tonnes
-            mass = 0.001 * self.ui.fert_input[self.fert_num].value()
-            nitrogen = self.ui.fert_nitrogen[self.fert_num].value() * 0.01
             freq = self.ui.fert_freq[self.fert_num].value()
             model = LitterModel.synthetic_fert(freq, mass, nitrogen)
         elif self.ui.fert_custombut[self.fert_num].isChecked():
-            mass = 0.001 * self.ui.fert_input[self.fert_num].value()
-            nitrogen = self.ui.fert_nitrogen[self.fert_num].value() * 0.01
-
             years = parse_regex(
                     str(self.ui.fert_customline[self.fert_num].text())
             )
-            years =  years[years>0]
-            years = years[years<=cfg.N_YEARS]
-            fertVec = np.zeros(cfg.N_YEARS)
+            years = years[(years>0) & (years<=n_years)]
+            fertVec = np.zeros(n_years)
             fertVec[years-1] = mass
             model = LitterModel.synthetic_fert(0,0,nitrogen,vector=fertVec)
         
         return model
 
 
+def _file_suffix(i, n, sep="_"):
+    """Suffix for the filenames of the (i+1)th of n crops, trees, etc.
+    - no suffix if there is only one, else the 1-indexed number.
+    """
+    return "" if n == 1 else "%s%d" % (sep, i+1)
+
+def _input_copy_path(src_file, suffix):
+    """Path in INP_DIR to copy the input csv src_file to,
+    with suffix added to the end of its name.
+    """
+    base = os.path.basename(src_file)
+    if base.endswith(".csv"):
+        base = base[:-4]
+    return os.path.join(cfg.INP_DIR, base + suffix + ".csv")
+
+def _printed(print_func):
+    """Return what print_func() prints to stdout 
+    (without the final newline, as for a line of the description).
+    """
+    out = StringIO()
+    with redirect_stdout(out):
+        print_func()
+    text = out.getvalue()
+    return text[:-1] if text.endswith("\n") else text
+
 def parse_regex(s):
     """Parse a string with a comma-separated list of numbers/ranges. 
     Return the numbers as a sorted array.
@@ -635,19 +599,14 @@ def parse_regex(s):
          "10,2,9-7" returns np.array([2,7,8,9,10])
     
     """
-    s = s.split(',')
-    data = []
-    for i in s:
-        if '-' in i:
-            j = i.split('-')
-            j[0] = int(j[0])
-            j[1] = int(j[1])
-            for k in range(min(j), max(j)+1):
-                if k:   # not empty string
-                    data.append(int(k))
-        else:
-            if i:   # not empty string
-                data.append(int(i))
+    pieces = []
+    for start, end in _RANGE_RE.findall(s):
+        start = int(start)
+        end = int(end) if end else start
+        if end < start:
+            start, end = end, start
+        pieces.append(np.arange(start, end+1))
     
-    return np.array(sorted(list(set(data))))
-
+    if not pieces:
+        return np.array([], dtype=int)
+    return np.unique(np.concatenate(pieces))
@@ -1,10 +1,16 @@
 
 """
-Module containing translate_ function. 
+Module containing translate_ function.
 Just a shorthand for QGui.QApplication.translate_
 """
 
-from PyQt5 import QtGui, QtWidgets
+from PyQt5 import QtCore
+
+# bound once rather than looked up on every call
+_translate = QtCore.QCoreApplication.translate
+
+# translated strings, keyed by source text
+_cache = {}
 
 
 def translate_(text):
@@ -12,8 +18,17 @@ def translate_(text):
     Add a QString to the list of translatable strings for the project.
     Acts as wrapper to QAppplication.translate_ function
     to save space basically
+
+    Results are cached - call clear_cache if the translator changes.
     """
-    
-    return QtWidgets.QApplication.translate(
-            "MainWindow", text, None
-    )
+    try:
+        return _cache[text]
+    except KeyError:
+        translated = _translate("MainWindow", text, None)
+        _cache[text] = translated
+        return translated
+
+
+def clear_cache():
+    """Forget cached translations (e.g. after installing a QTranslator)."""
+    _cache.clear()
@@ -19,11 +19,20 @@ class CropModel(object):
     Instance variables
     ------------------
     crop_params     CropParams object with crop params (slope, carbon, etc.)
-    output          output to soil,fire in t C ha^-1
-                        (dict with keys 'carbon','nitrogen','DMon','DMoff')
+    data            output to soil,fire in t C ha^-1
+                        (N_YEARS x 8 array, columns named in COLS)
+    output          dict of dicts view on data
+                        (keys 'above','below' then
+                         'carbon','nitrogen','DMon','DMoff')
 
     """
 
+    # columns of data, in order
+    COLS = (
+            'carbon_above', 'nitrogen_above', 'DMon_above', 'DMoff_above',
+            'carbon_below', 'nitrogen_below', 'DMon_below', 'DMoff_below'
+    )
+
     def __init__(self, crop_params, cropYield, leftInField):
         """Initialise crop object.
         
@@ -35,7 +44,17 @@ class CropModel(object):
         """
         
         self.crop_params = crop_params
-        self.output = self.get_inputs(cropYield, leftInField)
+        self.data = self.get_inputs(cropYield, leftInField)
+
+    @property
+    def output(self):
+        """Output as dict of dicts (e.g. output['above']['carbon'])
+        of column views on data, as used by the emissions code."""
+        output = {'above': {}, 'below': {}}
+        for i, col in enumerate(self.COLS):
+            s2, s1 = col.split('_')
+            output[s1][s2] = self.data[:, i]
+        return output
 
     def get_inputs(self, cropYield, leftInField):
         """Calculate and return soil carbon inputs, nitrogen inputs,
@@ -49,34 +68,30 @@ class CropModel(object):
             cropYield: yearly dry-matter crop yield (in t C ha^-1)
             leftInField: fraction left in field after harvest
         Returns:
-            output: dict with soil,fire inputs due to crop
-                     (keys='carbon','nitrogen','DMon','DMoff')
+            data: N_YEARS x 8 array with soil,fire inputs due to crop
+                  (columns in the order of COLS)
         """
 
-        # residues
-        res = cropYield*self.crop_params.slope + self.crop_params.intercept
-        res *= np.ones(cfg.N_YEARS)  # convert to array 
+        # residues - the same every year, so work out the
+        # yearly values as scalars and only fill the array at the end
+        params = self.crop_params
+        res = cropYield*params.slope + params.intercept
         resAG = res*leftInField
-        resBG = cropYield + res
-        resBG *= self.crop_params.rootToShoot * CropParams.ROOT_IN_TOP_30
-
-        output = {}
-        
-        # Standard outputs - in tonnes of carbon and as vectors
-        output['above'] = {
-                'carbon': resAG * self.crop_params.carbonAbove,
-                'nitrogen': resAG * self.crop_params.nitrogenAbove,
-                'DMon': resAG,
-                'DMoff': resAG * (1 - leftInField)
-        }
-        output['below'] = {
-                'carbon': resBG * self.crop_params.carbonBelow,
-                'nitrogen': resBG * self.crop_params.nitrogenBelow,
-                'DMon': resBG,
-                'DMoff': np.zeros(len(res))
-        }
-
-        return output
+        resBG = (cropYield + res) * (
+                params.rootToShoot * CropParams.ROOT_IN_TOP_30)
+
+        # Standard outputs - in tonnes of carbon, one column each
+        data = np.empty((cfg.N_YEARS, len(self.COLS)))
+        data[:, 0] = resAG * params.carbonAbove
+        data[:, 1] = resAG * params.nitrogenAbove
+        data[:, 2] = resAG
+        data[:, 3] = resAG * (1 - leftInField)
+        data[:, 4] = resBG * params.carbonBelow
+        data[:, 5] = resBG * params.nitrogenBelow
+        data[:, 6] = resBG
+        data[:, 7] = 0
+
+        return data
 
     def save_(self, file='crop_model.csv'):
         """Save output of crop model to a csv file.
@@ -86,12 +101,5 @@ class CropModel(object):
             file: name or path to csv file
 
         """
-        cols = []
-        data = []
-        for s1 in ['above', 'below']:
-            for s2 in ['carbon','nitrogen','DMon','DMoff']:
-                cols.append(s2+"_"+s1)
-                data.append(self.output[s1][s2])
-        data = np.column_stack(tuple(data))
-        io_.print_csv(file, data, col_names=cols)
+        io_.print_csv(file, self.data, col_names=list(self.COLS))
 
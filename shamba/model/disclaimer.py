@@ -1,4 +1,4 @@
-from PyQt5 import QtCore, QtGui
+from PyQt5 import QtCore, QtGui, QtWidgets
 
 from shamba.gui.translate_ import translate_ as _
 from shamba.gui import designer
@@ -25,7 +25,7 @@ class DisclaimerDialog(QtWidgets.QDialog):
      
         designer_dir = os.path.dirname(os.path.abspath(designer.__file__))
         image_dir = os.path.join(designer_dir, 'splash.jpg')
-        pix = QtWidgets.QPixmap(image_dir)
+        pix = QtGui.QPixmap(image_dir)
         self.ui.splashImage.setPixmap(pix.scaled(self.ui.splashImage.size(),QtCore.Qt.KeepAspectRatio))
         self.ui.disclaimerText.setText(_(DISCLAIMER))
 
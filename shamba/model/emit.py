@@ -207,7 +207,7 @@ class Emission(object):
         Return vector with differences.
         """
         # total of all pools
-        soc = np.sum(forRothC.SOC, axis=1)
+        soc = forRothC.tot_soc
         
         # To convert from [t C/ha] to [t CO2/ha]
         conversionFactor = 44.0/12
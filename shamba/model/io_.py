@@ -7,8 +7,11 @@ import os
 import logging as log
 import argparse
 import csv
+import stat
+from functools import lru_cache
 
 import numpy as np
+import pandas as pd
 from shamba.model import cfg
 from shamba import default_input
 
@@ -31,6 +34,50 @@ class FileOpenError(Exception):
         log.exception("Could not open %s" % filename)
 
 
+# folder with the default input files that come with shamba
+_DEFAULT_DIR = os.path.dirname(os.path.abspath(default_input.__file__))
+
+# absolute paths of input files that have already been found,
+# keyed by (fileIn, cfg.INP_DIR) so a new project folder is searched again
+_input_paths = {}
+
+
+def _stat_input(fileIn):
+    """Find an input file and return (absolute path, mtime in ns).
+
+    If full path not specified, search through the files in the 
+    project data folder /input, then in the 'defaults' folder.
+    Where the file was found is remembered, so later reads only
+    need the one stat call.
+
+    Raises:
+        FileOpenError: if file isn't in either folder, or at full path
+    """
+    key = (fileIn, cfg.INP_DIR)
+    path = _input_paths.get(key)
+    if path is not None:
+        try:
+            return path, os.stat(path).st_mtime_ns
+        except OSError:
+            # moved or deleted since - look for it again
+            del _input_paths[key]
+
+    for path in (
+            fileIn,
+            os.path.join(cfg.INP_DIR, fileIn),
+            os.path.join(_DEFAULT_DIR, fileIn)):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            path = os.path.abspath(path)
+            _input_paths[key] = path
+            return path, st.st_mtime_ns
+
+    # not in either folder, and not in full path
+    raise FileOpenError(fileIn)
+
 def print_csv(fileOut, array, col_names=[], 
         print_years=False, print_total=False, print_column=False):
     """Custom method for printing an array or list to a csv file.
@@ -45,13 +92,6 @@ def print_csv(fileOut, array, col_names=[],
         print_total: whether to print the total of each row in last column
         print_column: whether to print a 1d array to a column instead of row
     """
-    def round_(x):
-        try:
-            x = "%.5f" % x
-        except TypeError:
-            pass
-        return x
-    
     # See if existing path was given, put file in OUT_DIR if not
     if not os.path.isdir(os.path.dirname(fileOut)):
         fileOut = os.path.join(cfg.OUT_DIR, fileOut)
@@ -68,44 +108,63 @@ def print_csv(fileOut, array, col_names=[],
     else:
         isList = False
 
-    if print_total and not isList:
-        #Add total as last column
-        total = np.sum(array, axis=1)
-        col_names.append('total')
-        array = np.column_stack((array,total))
-
-    if print_years and not isList:
-        # Add years as first column
-        years = np.array(range(array.shape[0]))
-        col_names.insert(0, 'year')
-        array = np.column_stack((years,array))
+    if (print_total or print_years) and not isList:
+        # Make room for the extra columns with one allocation
+        # instead of column_stack-ing each one on
+        n, m = array.shape
+        first = int(print_years)
+        out = np.empty((n, first + m + int(print_total)))
+        out[:, first:first+m] = array
+
+        if print_total:
+            #Add total as last column
+            out[:, -1] = np.sum(array, axis=1)
+            col_names.append('total')
+
+        if print_years:
+            # Add years as first column
+            out[:, 0] = np.arange(n)
+            col_names.insert(0, 'year')
+
+        array = out
         
-    # manually do header since numpy 1.6 doesn't
-    # support header argument to savetxt - FFS
+    # newline='' so the '\n' line endings are written as they are
+    # (as the csv module expects), and a big buffer so the whole
+    # file usually goes out in one write
     try:
-        with open(fileOut, 'w') as outcsv:
+        with open(fileOut, 'w', buffering=1<<20, newline='') as outcsv:
             writer = csv.writer(outcsv,lineterminator='\n')
             writer.writerow(col_names)
             if isList:
+                # numbers to 5dp, anything else (e.g. names) as is
+                fmt = "%.5f".__mod__
+                number = (int, float, np.number)
                 for row in array:
                     if row:
-                        writer.writerow(map(lambda x: round_(x), row))
+                        writer.writerow([
+                                fmt(x) if isinstance(x, number) else x
+                                for x in row])
             else:
                 if array.ndim == 1 and print_column:
-                    np.savetxt(
-                            outcsv, np.atleast_2d(array).T, 
-                            delimiter=',', fmt="%.5f")
+                    array = np.atleast_2d(array).T
                 else:
                     # 2d
-                    np.savetxt(
-                            outcsv, np.atleast_2d(array), 
-                            delimiter=',', fmt='%.5f')
+                    array = np.atleast_2d(array)
+
+                # Same output as np.savetxt(fmt='%.5f') but formatted
+                # with one % over the whole array rather than per row
+                n, m = array.shape
+                rowFmt = ",".join(["%.5f"] * m) + "\n"
+                outcsv.write((rowFmt * n) % tuple(array.ravel().tolist()))
 
     except IOError:
         log.exception("Cannot print to file %s", fileOut)
 
 def read_csv(fileIn, cols=None):
-    """Read data from a .csv file. Usees numpy.loadtxt. 
+    """Read numeric data from a .csv file. Uses pandas.read_csv
+    (C parser) and squeezes the result like numpy.genfromtxt did.
+    Each file is only parsed once (until it is modified) - 
+    callers get their own copy of the cached array.
     
     Args: 
         fileIn: name of file to read
@@ -117,36 +176,40 @@ def read_csv(fileIn, cols=None):
 
     """
         
-    # if full path not specified, search through the files in the 
-    # project data folder /input, then in the 'defaults' folder
-    default_path = os.path.dirname(os.path.abspath(default_input.__file__))
-
-    if not os.path.isfile(fileIn):
-        if os.path.isfile(os.path.join(cfg.INP_DIR, fileIn)):
-            fileIn = os.path.join(cfg.INP_DIR, fileIn)
-        elif os.path.isfile(os.path.join(default_path, fileIn)):
-            fileIn = os.path.join(default_path, fileIn)
-        else:
-            # not in either folder, and not in full path
-            raise FileOpenError(fileIn)
-    
-    array = np.genfromtxt(
+    path, mtime = _stat_input(fileIn)
+    if cols is not None:
+        cols = tuple(cols)
+    array = _load_csv(path, mtime, cols)
+
+    return array.copy()
+
+@lru_cache(maxsize=128)
+def _load_csv(fileIn, mtime, cols):
+    """Parse fileIn for read_csv. Keyed on the modification time
+    so an edited file is re-read. Returned array is read-only."""
+    df = pd.read_csv(
             fileIn,
-            skip_header=1,
+            skiprows=1,
+            header=None,
             usecols=cols,
-            comments='#',
-            delimiter=','
+            comment='#'
     )
+    # non-numeric cells (e.g. plot names) become nan, as with genfromtxt
+    df = df.apply(pd.to_numeric, errors='coerce')
 
+    # to_numpy gives a Fortran-ordered view of pandas' column block
+    array = np.ascontiguousarray(df.to_numpy(), dtype=np.float64).squeeze()
+    array.setflags(write=False)
     return array
 
 def read_mixed_csv(fileIn, cols=None, types=None):
     """Read data from a mixed csv (strings and numbers). 
-    Uses numpy.loadfromtxt 
+    Uses pandas.read_csv and returns a structured array with
+    fields f0, f1, ... (as numpy.genfromtxt did).
+    Cached in the same way as read_csv.
 
-    NOTE: when used to read HWSD stuff (probably the primary
-    use of this method), make sure to use usecols=(0,1,2,3..12)
-    since genfromtxt seems to think there's 15 cols and gives an error
+    NOTE: quoted fields containing commas (e.g. in HWSD FAO90 names)
+    are parsed properly, unlike with genfromtxt
     
     Args:
         fileIn: name of file to be read
@@ -159,35 +222,44 @@ def read_mixed_csv(fileIn, cols=None, types=None):
         
     """
 
+    path, mtime = _stat_input(fileIn)
+    if cols is not None:
+        cols = tuple(cols)
+    if types is not None:
+        types = tuple(types)
+
     try:
-        if not os.path.isfile(fileIn):
-            if os.path.isfile(os.path.join(cfg.INP_DIR, fileIn)):
-                fileIn = os.path.join(cfg.INP_DIR, fileIn)
-            elif os.path.isfile(os.path.join(cfg.DEF_DIR, fileIn)):
-                fileIn = os.path.join(cfg.DEF_DIR, fileIn)
-            else:
-                # not in either folder, and not in full path
-                raise IOError 
-
-        array = np.genfromtxt(
-                fileIn,
-                usecols=cols,
-                dtype=types,
-                delimiter=',',
-                skip_header=1
-        )
+        array = _load_mixed_csv(path, mtime, cols, types)
     except IOError:
         raise FileOpenError(fileIn)
 
-    return array
+    return array.copy()
 
-def get_cl_args():
-    """
-    Parse the command line arguments for graph and report generation 
-    (-g, -r) and verbosity of output (-v=info,-vv=debug). 
-    Return args.
-    """
+@lru_cache(maxsize=128)
+def _load_mixed_csv(fileIn, mtime, cols, types):
+    """Parse fileIn for read_mixed_csv. Returned array is read-only."""
+    df = pd.read_csv(
+            fileIn,
+            usecols=cols,
+            header=None,
+            skiprows=1
+    )
+
+    if types is None:
+        array = df.to_records(index=False)
+    else:
+        array = np.empty(
+                len(df),
+                dtype=[("f%d" % i, t) for i, t in enumerate(types)]
+        )
+        for i, t in enumerate(types):
+            array["f%d" % i] = df.iloc[:, i].to_numpy().astype(t)
+
+    array.setflags(write=False)
+    return array
 
+def _build_parser():
+    """Make the parser for the command line arguments (see get_cl_args)."""
     parser = argparse.ArgumentParser()
     verboseMsg = "Set verbosity level (e.g. -v -v or vv more verbose than -v)"
     parser.add_argument(
@@ -204,16 +276,27 @@ def get_cl_args():
             "-g", "--graph", action="store_true", dest="graph",
             default=False, help="Show plots"
     )
+    return parser
+
+# built once - get_cl_args just parses with it
+_PARSER = _build_parser()
+
+# logging level for each number of v arguments
+_LEVELS = {0: log.WARNING, 1: log.INFO, 2: log.DEBUG}
+
+def get_cl_args():
+    """
+    Parse the command line arguments for graph and report generation 
+    (-g, -r) and verbosity of output (-v=info,-vv=debug). 
+    Return args.
+    """
 
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     # Set up logging level based on v arguments
-    if args.verbose == 2:
-        log.basicConfig(format="%(levelname)s: %(message)s", level=log.DEBUG)
-    elif args.verbose == 1:
-        log.basicConfig(format="%(levelname)s: %(message)s", level=log.INFO)
-    elif args.verbose == 0:
-        log.basicConfig(format="%(levelname)s: %(message)s")
+    level = _LEVELS.get(args.verbose)
+    if level is not None:
+        log.basicConfig(format="%(levelname)s: %(message)s", level=level)
 
     return args
 
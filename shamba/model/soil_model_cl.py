@@ -15,11 +15,23 @@ import logging as log
 
 import math
 import numpy as np
-from scipy import optimize, integrate
+from scipy import linalg
 import matplotlib.pyplot as plt
 
 from . import cfg, emit_cl, io_
 
+# RMFs already calculated, keyed by the soil, climate and cover values
+# they depend on (models in the same project usually share these)
+_rmf_cache = {}
+
+# times within a year at which the forward model is solved
+_SUBYEAR_T = np.arange(0, 1, 0.001)
+_SUBYEAR_T.setflags(write=False)
+
+# default soil cover for the inverse model (covered all year)
+_DEFAULT_COVER = np.ones(12)
+_DEFAULT_COVER.setflags(write=False)
+
     
 class RothC(object):
     
@@ -50,29 +62,53 @@ class RothC(object):
         self.climate = climate
         self.cover = cover
         self.k = self.get_rmf() * RothC.K_BASE
+
+        # Determine p_2 (fraction of input going to CO2) based on clay content
+        # and p_3 is always 0.46 (see RothC papaer) - same for every year
+        z = 1.67 * (1.85 + 1.6*math.exp(-0.0786 * soil.clay))
+        self._p2 = z/(z+1)
+        self._p3 = 0.46
     
     # Rate modifying-factor function - needed in forward and inverse
     def get_rmf(self):
         """Calculate the rate modifying factor b
         based on climate and soil cover.
+        Cached, so models with the same soil, climate and cover
+        only calculate it once.
         
         Returns:
             rmf: product of the all three RMFs (as a mean for the year)
 
         """
+        key = (
+                self.soil.clay, self.soil.depth,
+                np.asarray(self.climate.rain).tobytes(),
+                np.asarray(self.climate.evap).tobytes(),
+                np.asarray(self.climate.temp).tobytes(),
+                np.asarray(self.cover).tobytes()
+        )
+        try:
+            return _rmf_cache[key]
+        except KeyError:
+            rmf = self._calc_rmf()
+            _rmf_cache[key] = rmf
+            return rmf
+
+    def _calc_rmf(self):
+        """Calculate the rate modifying factor (see get_rmf)."""
         
         # Calculation of b (topsoil moisture deficit RMF)
         # Deficit is difference between rain and evaporation (pet/0.75)
         deficit = self.climate.rain - self.climate.evap
         m = self._get_first_pos_def(deficit)
         m, rainAlwaysExceedsEvap = self._get_first_neg_def(deficit, m)
-        b = np.ones(12)
         if rainAlwaysExceedsEvap:
-            return b.mean()
+            return 1.0      # b is 1 for every month
 
         # Rainfall < evap in month m, so
-        # tart calculating SMD from month before m
-        m -= 1
+        # start calculating SMD from month before m
+        months = (m - 1 + np.arange(12)) % 12
+        cover = np.asarray(self.cover)
         cc = self.soil.clay
         d = self.soil.depth
         max = -(20+ 1.3*cc - 0.01*(cc**2)) * (d/23.0)
@@ -82,63 +118,51 @@ class RothC(object):
         # Now define deficit as rain - pet
         deficit = self.climate.rain - self.climate.evap*0.75
         
-        # Loop through each month
-        for i in range(12):
-            accTsmd = self._get_acc_tsmd(
-                    accTsmd, deficit[m], self.cover[m], max)
-            if accTsmd >= 0.444*max:
-                b[m] = 1
-            elif accTsmd >= max:
-                b[m] = 0.2 + 0.8*(max-accTsmd) / (0.556*max)
-            else:
+        # Loop through each month (accTSMD depends on previous month)
+        get_acc_tsmd = self._get_acc_tsmd
+        for m, def_m, cover_m in zip(
+                months.tolist(), deficit[months].tolist(),
+                cover[months].tolist()):
+            accTsmd = get_acc_tsmd(accTsmd, def_m, cover_m, max)
+            if accTsmd < max:
                 log.error("DEFICIT = %5.2f" % accTsmd)
                 sys.exit(1)
-
             tsmd[m] = accTsmd
-            m += 1
-            if m > 11:
-                m = 0
+
+        b = np.where(
+                tsmd >= 0.444*max, 1.0,
+                0.2 + 0.8*(max-tsmd) / (0.556*max))
 
         # Temperature RMF (a)
-        a = np.zeros(12)
-        for i in np.where(self.climate.temp > -5.0):
-            a[i] = 47.91 / (1.0 + np.exp(106.06 / (self.climate.temp+18.27)))
+        temp = self.climate.temp
+        a = np.where(
+                temp > -5.0,
+                47.91 / (1.0 + np.exp(106.06 / (temp+18.27))),
+                0.0)
 
         # Soil cover RMF (c)
-        c = np.ones(12)
-        for i in np.where(self.cover == 1)[0]:
-            c[i] = 0.6
+        c = np.where(cover == 1, 0.6, 1.0)
 
         return (a*b*c).mean()   # yearly average of total RMF
 
     # Helper methods for finding b (topsoil moisture RMF)
     # Find first month where deficit > 0
     def _get_first_pos_def(self, deficit):
-        isSane = False
-        for i in np.where(deficit > 0):
-            if any(i):   # could be empty list
-                isSane = True
-                m = min(i)
-                break
-        
-        if not isSane:
+        isPos = deficit > 0
+        if not isPos.any():
             log.warning("EVAPORATION ALWAYS EXCEED RAINFALL")
-            m = 0
+            return 0
 
-        return m  # first month where deficit > 0
+        return int(np.argmax(isPos))  # first month where deficit > 0
     
     # Find first month after m where rainfall < evap (deficit<0)
     def _get_first_neg_def(self, deficit, m):
-        rainAlwaysExceedsEvap = True
-        for i in range(12):
-            m += 1
-            if m > 11:
-                m = 0
-            if deficit[m] < 0:
-                rainAlwaysExceedsEvap = False
-                break
+        after = (m + 1 + np.arange(12)) % 12  # months after m, wrapping
+        isNeg = deficit[after] < 0
+        if not isNeg.any():
+            return m, True
 
-        return m, rainAlwaysExceedsEvap
+        return int(after[np.argmax(isNeg)]), False
 
     # Get accTSMD for a given month
     def _get_acc_tsmd(self, smd, def_m, cover_m, max):
@@ -181,17 +205,33 @@ class RothC(object):
 
         """
 
+        # carbon lost from each pool by decay
+        decay = C * k
         # carbon gain from decay (goes to BIO, HUM, CO2)
-        bioHumIn = C[0]*k[0] + C[1]*k[1] + C[2]*k[2] + C[3]*k[3]
+        bioHumIn = decay.sum()
 
-        rhs = np.array([
-                input*x[0] - C[0]*k[0],
-                input*x[1] - C[1]*k[1],
-                bioHumIn*x[2] - C[2]*k[2],
-                bioHumIn*x[3] - C[3]*k[3]
-        ])
+        rhs = np.empty(4)
+        rhs[:2] = input*x[:2] - decay[:2]
+        rhs[2:] = bioHumIn*x[2:] - decay[2:]
 
         return rhs
+
+    def get_matrix(self, x, k):
+        """Matrix A for dC_dt written as the linear system
+        dC/dt = A.C + input*[x[0], x[1], 0, 0]
+
+        Args:
+            x: partitioning coefficient
+            k: rate constants
+        Returns:
+            A: 4x4 array
+
+        """
+        # pools decay at rate k, and BIO, HUM gain x[2], x[3]
+        # of everything that decays
+        A = np.outer([0, 0, x[2], x[3]], k)
+        A[np.diag_indices(4)] -= k
+        return A
     
 
 class InverseRothC(RothC):
@@ -207,7 +247,7 @@ class InverseRothC(RothC):
 
     """
     
-    def __init__(self, soil, climate, cover=np.ones(12)):
+    def __init__(self, soil, climate, cover=_DEFAULT_COVER):
         """Initialise inverse rothc object.
         
         Args:
@@ -232,29 +272,15 @@ class InverseRothC(RothC):
 
         # Partioning coefficients 
         x = self.get_partitions()
-        t = 0   # just needed to define for dC_dt function
-        C0 = np.array([0.1, 10, 0, 0])  # initial ballpark guess
-
-        # Keep track of difference b/t Ctot and Ceq
-        prevDiff = 1000.0
-
-        # Loop through range of inputs
-        for input in np.arange(0.01, 10, 0.001):
-            C = optimize.fsolve(self.dC_dt, C0, args=(t, x, self.k, input))
-            Ctot = C.sum() + self.soil.iom
-            currDiff = math.fabs(Ctot - self.soil.Ceq)
-
-            if currDiff < prevDiff:
-                prevDiff = currDiff
-                inputC = input
-                prevC = C
-                prevCtot = Ctot
-
-            if prevDiff < currDiff:
-                break
-        
-        eqC = prevC
-        eqInput = inputC
+
+        # dC_dt is linear in C, so the equilibrium for a given input
+        # is input * (equilibrium for unit input), i.e. solves
+        # A.C = -input*[x0,x1,0,0] - find input so total is Ceq
+        unitC = np.linalg.solve(
+                -self.get_matrix(x, self.k), [x[0], x[1], 0, 0])
+        eqInput = (self.soil.Ceq - self.soil.iom) / unitC.sum()
+        eqC = eqInput * unitC
+
         return eqC, eqInput, x
 
     def get_partitions(self):
@@ -265,12 +291,9 @@ class InverseRothC(RothC):
 
         """
         
-        # Determine p_2 (fraction of input going to CO2) based on clay content
-        z = 1.67 * (1.85 + 1.6*math.exp(-0.0786 * self.soil.clay))
-        p2 = z/(z+1)
-
-        # p_3 is always 0.46 (see RothC papaer
-        p3 = 0.46
+        # p_2 and p_3 don't depend on inputs (see __init__)
+        p2 = self._p2
+        p3 = self._p3
 
         # p_1 is dpm fraction of input:
         #   deciduous tropical woodland: dpm=0.2, rpm=0.8
@@ -316,6 +339,7 @@ class ForwardRothC(RothC):
     Instance variables
     ----------------
     SOC     vector with soil distributions for each year
+    tot_soc total of the (non-IOM) pools for each year
 
     """
     
@@ -339,6 +363,7 @@ class ForwardRothC(RothC):
         super(ForwardRothC, self).__init__(soil, climate, cover)
         self.SOC,self.inputs,self.Cy0Year = self.solver(
                 Ci, crop, tree, litter, fire, solveToValue) 
+        self.tot_soc = self.SOC.sum(axis=1)
     
     def solver(
             self, Ci,
@@ -347,7 +372,8 @@ class ForwardRothC(RothC):
         """ Run RothC in 'forward' mode; 
         solve dC_dt over a given time period
         or to a certain value, given a vector with soil inputs. 
-        Use scipy.integrate.odeint as a Runge-Kutta solver.
+        dC_dt is linear with constant coefficients over each year,
+        so it is solved exactly with a matrix exponential.
         
         Args: 
             crop: list of Crop objects (not reduced by fire)
@@ -371,7 +397,7 @@ class ForwardRothC(RothC):
 
         # Calculate yearly values of x based dpm:rpm ratio for each year
         x = self.get_partitions(inputs)
-        t = np.arange(0, 1, 0.001)
+        t = _SUBYEAR_T
         C = np.zeros((cfg.N_YEARS+1, 4))
         C[0] = Ci
         Ctot = np.zeros(cfg.N_YEARS+1)
@@ -382,34 +408,59 @@ class ForwardRothC(RothC):
         if solveToValue:
             prevDiff_outer = 1000.0
             prevDiff_inner = 1000.0
+            iom = self.soil.iom
+            Cy0 = self.soil.Cy0
         
+        # Same for every year
+        k = self.k
+        get_matrix = self.get_matrix
+        inputSums = inputs.sum(axis=1)
+        dt = t[1] - t[0]
 
         for i in range(1,cfg.N_YEARS+1):
             # Careful with indices - using 1-based for arrays here
             # since, e.g., C[2] should correspond to carbon after 2 years
 
 
-            # Solve the diffEQs to get pools for year i
-            Ctemp = integrate.odeint(
-                    self.dC_dt, C[i-1], t,
-                    args=(x[i-1], self.k, inputs[i-1].sum())
-            )
-            C[i] = Ctemp[-1]    # carbon pools at end of year
+            # Solve the diffEQs to get pools for year i -
+            # with dC/dt = A.C + b, C(t) = expm(A*t).(C0 + A^-1.b) - A^-1.b
+            xi = x[i-1]
+            A = get_matrix(xi, k)
+            b = inputSums[i-1] * np.array([xi[0], xi[1], 0, 0])
+            offset = np.linalg.solve(A, b)
+
+            if solveToValue:
+                # pools at each time in t - fill by doubling: rows
+                # [n, 2n) are rows [0, n) moved on by expm(A*n*dt)
+                Ctemp = np.empty((len(t), 4))
+                Ctemp[0] = C[i-1] + offset
+                stepT = linalg.expm(A * dt).T
+                n = 1
+                while n < len(t):
+                    m = min(n, len(t)-n)
+                    Ctemp[n:n+m] = Ctemp[:m].dot(stepT)
+                    stepT = stepT.dot(stepT)
+                    n += m
+                Ctemp -= offset
+                C[i] = Ctemp[-1]    # carbon pools at end of year
+            else:
+                C[i] = linalg.expm(A * t[-1]).dot(C[i-1] + offset) - offset
         
             # Check to see if close to target value
             if solveToValue:
-                j = -1
-                for c in Ctemp:
-                    j += 1
-                    Ctot = c.sum() + self.soil.iom
-                    currDiff = math.fabs(Ctot - self.soil.Cy0)
-
-                    if currDiff - prevDiff_inner < 0.00000001: 
-                        prevDiff_inner = currDiff
-                        c_inner = c
-                        closest_j = j
-                    else: # getting farther away 
-                        break
+                Ctot = Ctemp.sum(axis=1) + iom
+                currDiff = np.abs(Ctot - Cy0)
+
+                # step through the year while getting closer -
+                # stop at the first time that is farther away
+                farther = np.empty(len(t), dtype=bool)
+                farther[0] = not currDiff[0] - prevDiff_inner < 0.00000001
+                farther[1:] = ~(np.diff(currDiff) < 0.00000001)
+                n = np.argmax(farther) if farther.any() else len(t)
+                if n > 0:
+                    prevDiff_inner = currDiff[n-1]
+                    c_inner = Ctemp[n-1]
+                    closest_j = n-1
 
                 if prevDiff_inner < prevDiff_outer:
                     prevDiff_outer = prevDiff_inner
@@ -436,38 +487,30 @@ class ForwardRothC(RothC):
         
         """
         
-        # Determine p_2 (fraction of input going to CO2) based on clay content
-        z = 1.67 * (1.85 + 1.6*math.exp(-0.0786*self.soil.clay))
-        p2 = z/(z+1)
-
-        # p_3 is always 0.46 (see RothC papaer
-        p3 = 0.46
+        # p_2 and p_3 don't depend on inputs (see __init__)
+        p2 = self._p2
+        p3 = self._p3
 
         # p_1 is dpm fraction of input:
         #   deciduous tropical woodland: dpm=0.2, rpm=0.8
         #   crops: dpm=0.59, rpm=0.41
         # So weigh p_1 according to amount of trees/crops for each year
         
-        # Normalize
-        i = 0
+        # Normalize (years with no input are left as 0)
+        rowSum = inputs.sum(axis=1)
+        hasInput = np.abs(rowSum) >= 0.00000001
         normInput = np.zeros((cfg.N_YEARS,2))
-        for row in inputs:
-            if math.fabs(float(row.sum())) < 0.00000001:
-                normInput[i] = 0
-            else:
-                normInput[i] = inputs[i] / float(row.sum())
-            i += 1
+        normInput[hasInput] = inputs[hasInput] / rowSum[hasInput, None]
         
         # Weighted mean of dpm
-        p1 = np.array(0.59*normInput[:,0] + 0.2*normInput[:,1])
+        p1 = 0.59*normInput[:,0] + 0.2*normInput[:,1]
 
         # Construct x
-        # make arrays (p1 already array)
-        x = np.column_stack(
-                (p1, 1-p1, 
-                 np.array(cfg.N_YEARS * [p3*(1-p2)]), 
-                 np.array(cfg.N_YEARS * [(1-p2)*(1-p3)]))
-        )
+        x = np.empty((cfg.N_YEARS, 4))
+        x[:,0] = p1
+        x[:,1] = 1-p1
+        x[:,2] = p3*(1-p2)
+        x[:,3] = (1-p2)*(1-p3)
 
         return x
 
@@ -491,7 +534,7 @@ class ForwardRothC(RothC):
             ax.set_ylabel("SOC (t C ha^-1)")
             ax.set_title("Total soil carbon vs time")
     
-        tot_soc = np.sum(self.SOC, axis=1)
+        tot_soc = self.tot_soc
         if len(tot_soc) == cfg.N_YEARS+1:
             # baseline or project
             x = range(len(tot_soc))
@@ -501,7 +544,6 @@ class ForwardRothC(RothC):
             x = x - self.Cy0Year
             x[-1] = 0
 
-        tot_soc = np.sum(self.SOC, axis=1)
         ax.plot(x, tot_soc, label=legendStr)
         ax.legend(loc='best')
         
@@ -514,51 +556,54 @@ class ForwardRothC(RothC):
         print ("====================\n")
         print ("Length: ", cfg.N_YEARS, "years")
         print ("year carbon  crop_in  tree_in")
-        tot_soc = np.sum(self.SOC, axis=1)
-        if len(tot_soc) == cfg.N_YEARS+1:
-            for i in range(len(tot_soc)):
-                if i == cfg.N_YEARS:
-                    print (i, "  ",)
-                    print (tot_soc[i] + self.soil.iom)
-                else:
-                    print (i, "  ", )
-                    print (tot_soc[i] + self.soil.iom, "  ",)
-                    print (self.inputs[i][0], "  ", self.inputs[i][1])
+        soc = self.tot_soc + self.soil.iom
+        if len(soc) == cfg.N_YEARS+1:
+            years = ["%4d" % i for i in range(len(soc))]
         else:
-            x = np.array(range(-len(tot_soc)+2,2))
+            x = np.array(range(-len(soc)+2,2))
             x = x - self.Cy0Year
             x[-1] = 0
-            for i in range(len(tot_soc)):
-                print ("%6.3f" % (x[i]),)
-                print ("  ",)
-                print (tot_soc[i] + self.soil.iom, "  ",)
-                if i == len(tot_soc)-1:
-                    pass
-                else:  
-                    print (self.inputs[i][0], "  ",self.inputs[i][1])
+            years = ["%6.3f" % year for year in x]
+
+        # one line per year - no inputs after the last year
+        lines = [
+                "%s   %8.3f   %8.3f   %8.3f" % (
+                        years[i], soc[i], 
+                        self.inputs[i][0], self.inputs[i][1])
+                for i in range(len(soc)-1)
+        ]
+        lines.append("%s   %8.3f" % (years[-1], soc[-1]))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def save_(self, file='soil_model_forward.csv'):
         """Save data from forward RothC run to a csv.
         Default path is OUT_DIR.
 
         """
-        tot_soc = np.sum(self.SOC, axis=1)
-        inputs = np.append(self.inputs, [[0,0]], axis=0)
-        data = np.column_stack(
-                (tot_soc+self.soil.iom, self.SOC, 
-                 np.array(len(tot_soc)*[self.soil.iom]),
-                 inputs[:,0], inputs[:,1])
-                )
+        tot_soc = self.tot_soc
         cols = [
                 'soc', 'dpm', 'rpm', 'bio', 'hum', 
                 'iom', 'crop_in', 'tree_in'
         ]
-        if len(tot_soc) != cfg.N_YEARS+1:   # solve to value
+        solvedToValue = len(tot_soc) != cfg.N_YEARS+1
+
+        # fill the output in place - with a (fractional) year column
+        # first if solved to value
+        first = int(solvedToValue)
+        data = np.empty((len(tot_soc), first+len(cols)))
+        out = data[:, first:]
+        out[:,0] = tot_soc + self.soil.iom
+        out[:,1:5] = self.SOC
+        out[:,5] = self.soil.iom
+        out[:-1,6:] = self.inputs
+        out[-1,6:] = 0      # no inputs after the last year
+
+        if solvedToValue:
             cols.insert(0, 'year')
             x = np.array(range(-len(tot_soc)+2,2))
             x = x - self.Cy0Year
             x[-1] = 0
-            data = np.column_stack((x,data))
+            data[:,0] = x
             io_.print_csv(file, data, col_names=cols)
         else:
             io_.print_csv(file, data, col_names=cols, print_years=True)
@@ -5,6 +5,7 @@
 import logging as log
 import os
 import sys
+from functools import lru_cache
 
 import numpy as np
 from osgeo import gdal, gdalconst
@@ -126,8 +127,11 @@ class SoilParams(object):
         io_.print_csv(file, data, col_names=cols)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_identifier(location):
-        """Find MU_GLOBAL for given location from the HWSD .bil raster."""
+        """Find MU_GLOBAL for given location from the HWSD .bil raster.
+        Cached, since every baseline/intervention uses the same location.
+        """
 
         y = location[0] # lat
         x = location[1] # long
@@ -171,8 +175,11 @@ class SoilParams(object):
         return value
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_data_from_identifier(mu):
-        """Get soil data from csv given MU_GLOBAL from the raster."""
+        """Get soil data from csv given MU_GLOBAL from the raster.
+        Cached so HWSD_data.csv is only read once for each MU_GLOBAL.
+        """
 
         filename = os.path.join(
                 os.path.dirname(os.path.abspath(soil_raster.__file__)),
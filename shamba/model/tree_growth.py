@@ -12,7 +12,6 @@ import os
 import logging as log
 
 import numpy as np
-import math
 from scipy import optimize
 import matplotlib.pyplot as plt
 
@@ -33,6 +32,8 @@ class TreeGrowth(object):
     age         tree age data in years
     diam        tree diameter data in cm
     best        string with best fit ('exp, 'log', 'lin, or 'hyp')
+    bestFunc    fitting function for the best fit
+    bestDeriv   derivative function for the best fit
     fitDiam     dict holding fit diameter data in cm for all four fits 
     fitParams   dict holding fitting params for all four fits
     fitMSE      dict holding MSE for all four fits
@@ -68,14 +69,14 @@ class TreeGrowth(object):
                 sys.exit(1)
 
         if 'biomass' not in growth_params:
-            self.biomass = np.zeros(len(self.diam))
             try:
-                for i in range(len(self.diam)):
-                    self.biomass[i] = allometric[self.allom](
-                            self.diam[i], tree_params)
+                allom_fn = allometric[self.allom]
             except KeyError:
                 log.exception("Allometric is not recognized")
                 sys.exit(1)
+            # allometrics work on the whole diameter array at once
+            self.biomass = allom_fn(
+                    np.asarray(self.diam, dtype=float), tree_params)
 
         # Dictionaries for fitting functions and derivatives
         self.func = {
@@ -95,6 +96,8 @@ class TreeGrowth(object):
         self.fitData = self.allFitData[self.best]
         self.fitParams = self.allFitParams[self.best]
         self.fitMse = self.allMse[self.best]
+        self.bestFunc = self.func[self.best]
+        self.bestDeriv = self.funcDeriv[self.best]
     
     @classmethod
     def from_csv(
@@ -153,20 +156,52 @@ class TreeGrowth(object):
                 'lin': [1], 'log': [100, 0,0]}
         numParams = {'exp': 1, 'hyp': 2, 
                      'lin': 1, 'log': 3}
+        # partial derivatives wrt the fit params (saves curve_fit
+        # estimating them by finite differences)
+        jac = {'exp': self.exp_fn_jac, 'hyp': self.hyp_fn_jac,
+               'log': self.log_fn_jac}
+        # search space for the global fit if curve_fit fails
+        maxAge = float(np.max(self.age))
+        maxBiomass = max(float(np.max(np.abs(self.biomass))), 1.0)
+        searchBounds = {
+                'exp': [(0, 10)],
+                'hyp': [(0, 10*maxBiomass), (0, 10)],
+                'log': [(0, 10*maxBiomass), (0, 10), (-maxAge, 2*maxAge)]
+        }
 
         for curve in self.func:
             # Do the fitting
             try:
-                fitParams = optimize.curve_fit(self.func[curve], self.age,
-                                               self.biomass, init[curve]
-                )
-                par = fitParams[0]
+                if curve == 'lin':
+                    # least squares for a*x has a closed form
+                    par = np.array([
+                            np.dot(self.age, self.biomass)
+                            / np.dot(self.age, self.age)
+                    ])
+                    fitParams = (par,)
+                else:
+                    fitParams = optimize.curve_fit(
+                            self.func[curve], self.age,
+                            self.biomass, init[curve], jac=jac[curve]
+                    )
+                    par = fitParams[0]
                 params[curve] = par
                 
             except RuntimeError:
-                log.warning("Could not fit data to %s",curve)
-                fitParams = None
-                par = None
+                # fall back to a (slower) global search
+                with np.errstate(over='ignore', invalid='ignore'):
+                    result = optimize.differential_evolution(
+                            self.sse_fn, searchBounds[curve],
+                            args=(self.func[curve],), seed=1
+                    )
+                if result.success and np.isfinite(result.fun):
+                    par = result.x
+                    fitParams = (par,)
+                    params[curve] = par
+                else:
+                    log.warning("Could not fit data to %s",curve)
+                    fitParams = None
+                    par = None
 
             # Find data corresponding to those fitting params
             # Set data and params to array of nan if there's no fit
@@ -206,19 +241,20 @@ class TreeGrowth(object):
     # Functions to fit to
     def hyp_fn(self, x, a, b):
         return a * (1 - np.exp(-b*x))
+
+    def hyp_fn_jac(self, x, a, b):
+        e = np.exp(-b*x)
+        return np.column_stack((1 - e, a * x * e))
     
     def hyp_fn_inv(self, y):
-        if math.fabs(y) < 0.00000001:
-            x = 0
-        else:
-            a = self.fitParams[0]
-            b = self.fitParmas[1]
-            if y > a:
-                x = a
-            else:
-                x = (math.log(a) - math.log(a-y)) / b
+        y = np.asarray(y, dtype=float)
+        a = self.fitParams[0]
+        b = self.fitParams[1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x = np.where(y > a, a, -np.log1p(-y/a) / b)
+        x = np.where(np.abs(y) < 0.00000001, 0.0, x)
 
-        return x 
+        return x[()]    # scalar if y was
 
     def hyp_fn_deriv(self, x):
         a = self.fitParams[0]
@@ -229,13 +265,11 @@ class TreeGrowth(object):
         return a * x 
     
     def lin_fn_inv(self, y):
-        if math.fabs(y) < 0.00000001:
-            x = 0
-        else:
-            a = float(self.fitParams[0])     # just to be safe
-            x = y / a
+        y = np.asarray(y, dtype=float)
+        a = float(self.fitParams[0])     # just to be safe
+        x = np.where(np.abs(y) < 0.00000001, 0.0, y / a)
 
-        return x
+        return x[()]
 
     def lin_fn_deriv(self, y):
         x = self.lin_fn_inv(y)
@@ -245,20 +279,23 @@ class TreeGrowth(object):
 
     def log_fn(self, x, a, b, c):
         return a / (1 + np.exp(-b*(x-c)))
+
+    def log_fn_jac(self, x, a, b, c):
+        s = 1 / (1 + np.exp(-b*(x-c)))
+        ds = a * s * (1-s)
+        return np.column_stack((s, (x-c) * ds, -b * ds))
    
     def log_fn_inv(self, y):
-        if math.fabs(y) < 0.00000001:
-            x = 0
-        else:
-            a = self.fitParams[0]
-            b = self.fitParams[1]
-            c = self.fitParams[2]
-            if y > a:   # should tend towards a
-                x = a
-            else:
-                x = c + (math.log(y)-math.log(a-y)) / b
+        y = np.asarray(y, dtype=float)
+        a = self.fitParams[0]
+        b = self.fitParams[1]
+        c = self.fitParams[2]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # should tend towards a
+            x = np.where(y > a, a, c + (np.log(y)-np.log(a-y)) / b)
+        x = np.where(np.abs(y) < 0.00000001, 0.0, x)
 
-        return x
+        return x[()]
 
     def log_fn_deriv(self, y): 
         x = self.log_fn_inv(y)
@@ -272,22 +309,31 @@ class TreeGrowth(object):
 
     def exp_fn(self, x, a):
         return (1+a)**x -1
+
+    def exp_fn_jac(self, x, a):
+        return np.column_stack((x * (1+a)**(x-1),))
     
     def exp_fn_inv(self, y):
-        if math.fabs(y) < 0.00000001:
-            x = 0
-        else:
-            a = self.fitParams[0]
-            x = math.log(y+1) / math.log(a+1)
+        y = np.asarray(y, dtype=float)
+        a = self.fitParams[0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x = np.log1p(y) / np.log1p(a)
+        x = np.where(np.abs(y) < 0.00000001, 0.0, x)
 
-        return x
+        return x[()]
 
     def exp_fn_deriv(self, x):
         a = self.fitParams[0]
         return ((1+a)**x) * (np.log(1+a))
 
+    def sse_fn(self, params, func):
+        """Sum of squared residuals of func with params to the data."""
+        diff = func(self.age, *params) - self.biomass
+        return np.dot(diff, diff)
+
     def mse_fn(self, yMean, yReal):
-        return ((yMean - yReal)**2).mean()
+        diff = np.ravel(yMean - yReal)
+        return np.dot(diff, diff) / diff.size
 
     def plot_(self, fit=True, saveName=None):
         """Plot growth data and all four fits in a matplotlib figure."""
@@ -336,20 +382,25 @@ class TreeGrowth(object):
         print ("\n  Age    Diameter  Biomass")
         print ("(years)    (cm)     (kg C)")
         print ("--------------------------")
-        for i in range(len(self.age)):
-            print ("  %2d      %5.2f     %6.2f" % (
-                    self.age[i], self.diam[i], self.biomass[i]))
+        rows = [
+                "  %2d      %5.2f     %6.2f" % (
+                        self.age[i], self.diam[i], self.biomass[i])
+                for i in range(len(self.age))
+        ]
+        sys.stdout.write("\n".join(rows) + "\n")
         if fit:
             print ("\n Data      Exp.     Hyp.     Lin.     Log.")
             print ("-----------------------------------------")
-            for i in range(len(self.age)):
-                print ("%6.2f   %6.2f   %6.2f   %6.2f   %6.2f" % (
-                        self.biomass[i], 
-                        self.allFitData['exp'][i],
-                        self.allFitData['hyp'][i],
-                        self.allFitData['lin'][i], 
-                        self.allFitData['log'][i])
-                )
+            rows = [
+                    "%6.2f   %6.2f   %6.2f   %6.2f   %6.2f" % (
+                            self.biomass[i], 
+                            self.allFitData['exp'][i],
+                            self.allFitData['hyp'][i],
+                            self.allFitData['lin'][i], 
+                            self.allFitData['log'][i])
+                    for i in range(len(self.age))
+            ]
+            sys.stdout.write("\n".join(rows) + "\n")
         if params and mse:
             print ("\nMSE      %6.2f   %6.2f   %6.2f   %6.2f" % (
                     self.allMse['exp'], 
@@ -397,25 +448,14 @@ class TreeGrowth(object):
         
         # fit parameters
         param_file = file.split(".csv")[0] + "_fit_params.csv"
-        temp = {'exp':[], 'hyp':[], 'lin':[], 'log':[]}
-        row1 = []
-        row2 = []
-        row3 = []
-        row4 = []
-        for s in ['exp', 'hyp', 'lin', 'log']:
-            row1.append(self.allMse[s])
-            row2.append(self.allFitParams[s][0])
-            try:
-                row3.append(self.allFitParams[s][1])
-            except IndexError:
-                row3.append('')
-            try:
-                row4.append(self.allFitParams[s][2])
-            except IndexError:
-                row4.append('')
-        
-        data = [row1, row2, row3, row4]
+        # mse then the a,b,c params - blank where a fit has fewer params
         cols = ['exp', 'hyp', 'lin', 'log']
+        params = [self.allFitParams[s] for s in cols]
+        data = [[self.allMse[s] for s in cols]]
+        data += [
+                [p[k] if k < len(p) else '' for p in params]
+                for k in range(3)
+        ]
         io_.print_csv(param_file, data, col_names=cols)
 
         # biomass, and four fits
@@ -439,44 +479,71 @@ def log_allom(params, d, dens=None):
                 with p[0] multiplied by highest power of ln(d)
                 e.g. p=np.array([2.601, -3.629])
                      -> agb = exp(2.601*log(d)-3.629) (kg) is the ryan allom
-        d: diameter
+        d: diameter (scalar or array)
         dens: tree density (only needed for some allometrics)
     Returns:
-        agb: agb corresponding to diameter of d
+        agb: agb corresponding to diameter of d (0 where d is 0)
         
     """
-    if math.fabs(d) < 0.00000001:
-        agb = 0
-    else:
-        logd = math.log(d)
-        agb = np.polyval(params, logd)
-        agb = math.exp(agb)     # kg C
-        if dens is not None:    # for Chave allometric (and possibly others)
-            agb *= dens
+    logd, isZero = _log_diam(d)
+    return _exp_poly(params, logd, isZero, dens)
+
+def _log_diam(d):
+    """Return ln(d) (with 0 where d is 0) and the mask of zero diameters,
+    so allometrics summing several log_alloms only take the log once.
+    
+    """
+    d = np.asarray(d, dtype=float)
+    isZero = np.abs(d) < 0.00000001
+    logd = np.zeros_like(d)
+    np.log(d, out=logd, where=~isZero)
+    return logd, isZero
+
+def _exp_poly(params, logd, isZero, dens=None):
+    """log_allom for an already logged diameter."""
+    agb = np.asarray(np.exp(np.polyval(params, logd)))     # kg C
+    if dens is not None:    # for Chave allometric (and possibly others)
+        agb *= dens
+    np.copyto(agb, 0.0, where=isZero)
     
-    return agb
+    return agb[()]      # scalar if d was
+
+# Fit params for the specific allometrics below
+_RYAN = np.array([2.601,-3.629])
+_GREVILLEA = (np.array([3.06,-5.5]), np.array([1.32,1.06]))
+_MAESOPSIS = (np.array([3.33,-7.02]), np.array([2.38,-2.9]))
+_MARKHAMIA = (np.array([2.63,-4.91]), np.array([2.43,-3.08]))
+_CHAVE_DRY = np.array([-0.0281,0.207,1.784,-0.667])
+_CHAVE_MOIST = np.array([-0.0281,0.207,2.148,-1.499])
+_CHAVE_WET = np.array([-0.0281,0.207,1.98,-1.239])
+
+def _tumwebaze(params, dbh):
+    """Sum of the two log allometrics in a Tumwebaze et al. fit."""
+    logd, isZero = _log_diam(dbh)
+    return (_exp_poly(params[0], logd, isZero) 
+            + _exp_poly(params[1], logd, isZero))
 
 # Some specific log allometrics
 # All take dbh vectors and tree object as arguments
 def ryan(dbh, tree_params):
     """C. Ryan, biotropica (2010)."""
-    return log_allom([2.601,-3.629], dbh)
+    return log_allom(_RYAN, dbh)
 
 def tumwebaze_grevillea(dbh, tree_params):
     """Tumwebaze et al. (2013) - Grevillea."""
 
-    agb = log_allom([3.06,-5.5], dbh) + log_allom([1.32,1.06], dbh)
+    agb = _tumwebaze(_GREVILLEA, dbh)
     return agb * tree_params.carbon
 
 def tumwebaze_maesopsis(dbh, tree_params):
     """Tumwebaze et al. (2013) - Maesopsis."""
 
-    agb = log_allom([3.33,-7.02], dbh) + log_allom([2.38,-2.9], dbh)
+    agb = _tumwebaze(_MAESOPSIS, dbh)
     return agb * tree_params.carbon    
 
 def tumwebaze_markhamia(dbh, tree_params):
     """Tumwebaze et al. (2013) - Markhamia."""
-    agb = log_allom([2.63,-4.91], dbh) + log_allom([2.43,-3.08], dbh)
+    agb = _tumwebaze(_MARKHAMIA, dbh)
     return agb * tree_params.carbon
 
 def chave_dry(dbh, tree_params):
@@ -484,7 +551,7 @@ def chave_dry(dbh, tree_params):
     with < 1500 mm/year rainfall, > 5 months dry season
         
     """
-    agb = log_allom([-0.0281,0.207,1.784,-0.667], dbh, dens=tree_params.dens)
+    agb = log_allom(_CHAVE_DRY, dbh, dens=tree_params.dens)
     return agb * tree_params.carbon
 
 def chave_moist(dbh, tree_params):
@@ -492,7 +559,7 @@ def chave_moist(dbh, tree_params):
     with 1500-3000 mm/year rainfall, 1-4 months dry season
     
     """
-    agb = log_allom([-0.0281,0.207,2.148,-1.499], dbh, dens=tree_params.dens)
+    agb = log_allom(_CHAVE_MOIST, dbh, dens=tree_params.dens)
     return agb * tree_params.carbon
 
 def chave_wet(dbh, tree_params):
@@ -500,7 +567,7 @@ def chave_wet(dbh, tree_params):
     with > 3500 mm/year rainfall, no seasonality
     
     """
-    agb = log_allom([-0.0281,0.207,1.98,-1.239], dbh, dens=tree_params.dens)
+    agb = log_allom(_CHAVE_WET, dbh, dens=tree_params.dens)
     return agb * tree_params.carbon
     
 allometric = {
@@ -143,45 +143,34 @@ class TreeModel(object):
         standDens = np.zeros(cfg.N_YEARS+1) 
         standDens[yp] = initialStandDens
 
+        # live turnover is the same every year - only these vary
         inputParams = {
-                'live': np.array(
-                                (cfg.N_YEARS+1) * [self.turnover]),
                 'thin': self.thin,
                 'dead': self.mort
         }
-        retainedFrac = {
-                'live': 1,
-                'thin': self.thinFrac,
-                'dead': self.mortFrac
-        }
-        
-        # initialise stuff
-        pools = np.zeros((cfg.N_YEARS+1,5))
-        woodyBiom = np.zeros((cfg.N_YEARS+1,5))
-        tNPP = np.zeros(cfg.N_YEARS+1)
-
-        flux = {}
-        inputs = {}
-        exports = {}
-        for s in ['live', 'dead', 'thin']:
-            flux[s] = np.zeros((cfg.N_YEARS+1,5))
-            inputs[s] = np.zeros((cfg.N_YEARS+1,5))
-            exports[s] = np.zeros((cfg.N_YEARS+1,5))
+        # rows of flux/retainedFrac are the 'live', 'dead', 'thin' sources
+        retainedFrac = np.array([np.ones(5), self.mortFrac, self.thinFrac])
+        exportFrac = 1 - retainedFrac
         
-        inputC = np.zeros((cfg.N_YEARS+1,5))
-        exportC = np.zeros((cfg.N_YEARS+1,5))
-        biomGrowth = np.zeros((cfg.N_YEARS+1,5))
+        # initialise stuff - the yearly (N_YEARS+1,5) pool arrays and
+        # the yearly totals each share one allocation
+        pools, woodyBiom, inputC, exportC, biomGrowth = np.zeros(
+                (5,cfg.N_YEARS+1,5))
+        tNPP, in_, acc, bal, out = np.zeros((5,cfg.N_YEARS+1))
+        growthDeriv = self.tree_growth.bestDeriv
+
+        flux = np.zeros((3,5))     # this year's flux from each source
         
         # set woodyBiom[0] to initial (allocated appropriately)
         pools[yp] = initialBiomass * self.alloc
         woodyBiom[yp] = pools[yp] * standDens[yp]
-        for s in inputs:
-            flux[s][yp] = woodyBiom[yp] * inputParams[s][yp]    
 
-        in_ = np.zeros(cfg.N_YEARS+1)
-        acc = np.zeros(cfg.N_YEARS+1)
-        bal = np.zeros(cfg.N_YEARS+1)
-        out = np.zeros(cfg.N_YEARS+1)
+        # stand density only depends on the thinning and mortality
+        standDens[yp:] = np.cumprod(np.r_[
+                standDens[yp],
+                1 - (inputParams['dead'][yp+1:cfg.N_YEARS+1] 
+                     + inputParams['thin'][yp+1:cfg.N_YEARS+1])
+        ])
        
         for i in range(1+yearPlanted,cfg.N_YEARS+1):
             # Careful with indices - using 1-based here
@@ -191,27 +180,21 @@ class TreeModel(object):
             agb = pools[i-1][1] + pools[i-1][2]
             
             # Growth for one tree
-            tNPP[i] = self.tree_growth.funcDeriv[self.tree_growth.best](agb)
+            tNPP[i] = growthDeriv(agb)
             biomGrowth[i] = tNPP[i] * self.alloc * standDens[i-1]
             
-            for s in inputs:
-                flux[s][i] = inputParams[s][i] * pools[i-1] * \
-                            standDens[i-1]
-                inputs[s][i] = retainedFrac[s] * flux[s][i]
-                exports[s][i] = (1-retainedFrac[s]) * flux[s][i]
+            flux[0] = self.turnover * pools[i-1] * standDens[i-1]
+            flux[1] = inputParams['dead'][i] * pools[i-1] * standDens[i-1]
+            flux[2] = inputParams['thin'][i] * pools[i-1] * standDens[i-1]
 
             # Totals (in t C / ha)
-            inputC[i] = sum(inputs.values())[i]
-            exportC[i] = sum(exports.values())[i]
+            inputC[i] = (retainedFrac * flux).sum(axis=0)
+            exportC[i] = (exportFrac * flux).sum(axis=0)
             
             woodyBiom[i] = woodyBiom[i-1] 
             woodyBiom[i] += biomGrowth[i]
-            woodyBiom[i] -= sum(flux.values())[i]
+            woodyBiom[i] -= flux.sum(axis=0)
 
-            standDens[i] = standDens[i-1]
-            standDens[i] *= 1 - (
-                    inputParams['dead'][i] + inputParams['thin'][i]
-            )
             pools[i] = woodyBiom[i] / standDens[i]
 
             # Balance stuff
@@ -234,9 +217,7 @@ class TreeModel(object):
         woodyBiom *= 0.001  # convert to tonnes for emissions calc.
         C = inputC[0:cfg.N_YEARS]
         DM = C / self.tree_params.carbon
-        N = np.zeros((cfg.N_YEARS,5))
-        for i in range(cfg.N_YEARS):
-            N[i] = self.tree_params.nitrogen[0:cfg.N_YEARS] * DM[i]
+        N = DM * self.tree_params.nitrogen     # nitrogen is per pool
         
         output = {}
         output['above'] = {
@@ -295,8 +276,11 @@ class TreeModel(object):
         print ("=============\n")
         totalBiomass = np.sum(self.woodyBiom, axis=1)
         print ("year  biomass")
-        for i in range(len(totalBiomass)):
-            print (i, "  ",totalBiomass[i] )
+        rows = [
+                "%d    %s" % (i, totalBiomass[i]) 
+                for i in range(len(totalBiomass))
+        ]
+        sys.stdout.write("\n".join(rows) + "\n")
 
     def print_balance(self):
         print ("\nMass-balance sum (kg C /ha): ", self.balance['bal'].sum())
@@ -3,43 +3,54 @@
 import logging as log
 import os
 import sys
+from functools import lru_cache
 
 import numpy as np
 from shamba.model import io_, cfg
 
 
 # ----------------------------------
-# Read species data from csv
-# (run when this module is imported)
+# Species data from csv
+# (read the first time it's needed)
 # ---------------------------------- 
 # abridged species list
 SPP_LIST = [
         'default',
 ]
 
-TREE_SPP = {}
-_data = io_.read_csv('tree_defaults.csv',cols=(2,3,4,5,6,7,8,9))
-_data = np.atleast_2d(_data)
-_nitrogen = np.zeros((len(SPP_LIST),5))
-for _i in range(len(SPP_LIST)):
-    _nitrogen[_i] = np.array(
-            [_data[_i,0],_data[_i,1],_data[_i,2],_data[_i,3],_data[_i,4]]
-    )
-
-_carbon = _data[:,5]
-_rootToShoot = _data[:,6]
-_dens = _data[:,7]
-
-for _i in range(len(SPP_LIST)):
-    _spp = SPP_LIST[_i]
-    TREE_SPP[_spp] = {
-            'species': _spp,
-            'dens': _dens[_i],
-            'carbon': _carbon[_i],
-            'nitrogen': _nitrogen[_i],
-            'rootToShoot': _rootToShoot[_i]
+# row of each species in the defaults csv
+_SPP_INDEX = {spp: i for i,spp in enumerate(SPP_LIST)}
+
+@lru_cache(maxsize=None)
+def _load_defaults():
+    """Read the species defaults csv (on first use rather than at import,
+    and only once). Returns array with a row per species in SPP_LIST, 
+    columns are N_leaf, N_branch, N_stem, N_croot, N_froot, C, rw, dens.
+    
+    """
+    data = io_.read_csv('tree_defaults.csv',cols=(2,3,4,5,6,7,8,9))
+    return np.atleast_2d(data)
+
+def _species_params(species):
+    """Return params dict (as used by TreeParams) for a species in 
+    SPP_LIST. Raises KeyError if species isn't in SPP_LIST."""
+    row = _load_defaults()[_SPP_INDEX[species]]
+    return {
+            'species': species,
+            'dens': row[7],
+            'carbon': row[5],
+            'nitrogen': row[0:5].copy(),
+            'rootToShoot': row[6]
     }
 
+def __getattr__(name):
+    """Module attribute hook so TREE_SPP (dict of the params dict for 
+    each species) is still available - built from the defaults array."""
+    if name == 'TREE_SPP':
+        return {spp: _species_params(spp) for spp in SPP_LIST}
+    raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+
 
 # -------------------------------------------------------
 # Tree object, holding info for a particular type of tree
@@ -98,7 +109,7 @@ class TreeParams(object):
         """
         species = species.lower()
         try:
-            tree = cls(TREE_SPP[species])
+            tree = cls(_species_params(species))
         except KeyError:
             log.exception(
                 "Could not find species data in defaults for %s" % species)
@@ -122,7 +133,7 @@ class TreeParams(object):
         try:
             index = int(index)
             species = SPP_LIST[index-1]
-            tree = cls(TREE_SPP[species])
+            tree = cls(_species_params(species))
         except IndexError:
             log.exception(
                     "Could not find species data corresponding to " + \
@@ -152,12 +163,7 @@ class TreeParams(object):
         try:
             params = {
                     'species': speciesName,
-                    'nitrogen': np.array([data[row,0],
-                                          data[row,1],
-                                          data[row,2],
-                                          data[row,3],
-                                          data[row,4]
-                                ]),
+                    'nitrogen': data[row,0:5].copy(),
                     'carbon': data[row,5],
                     'rootToShoot': data[row,6],
                     'dens': data[row,7]
@@ -178,10 +184,7 @@ class TreeParams(object):
 
         """
         # index is 0 if not in the SPP_LIST
-        if self.species in SPP_LIST:
-            index = SPP_LIST.index(self.species) + 1
-        else:
-            index = 0
+        index = _SPP_INDEX.get(self.species, -1) + 1
 
         data = [
                 index, self.species, self.nitrogen[0], self.nitrogen[1],